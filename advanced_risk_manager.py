@@ -2,7 +2,110 @@ import numpy as np
 from datetime import datetime
 import logging
 
+from src.numba_compat import njit
+
+
+@njit('float64(float64, float64, float64, int64)', cache=True, fastmath=True)
+def _calc_position_size(risk_amount, entry, stop, consec_losses):
+    """Risk-based position size for a single entry"""
+    price_risk = abs(entry - stop) / entry
+
+    if price_risk == 0:
+        return 0.0
+
+    position_value = risk_amount / price_risk
+    position_size = position_value / entry
+
+    # Adjust for consecutive losses
+    if consec_losses >= 3:
+        position_size *= 0.5
+
+    return position_size
+
+
+@njit('Tuple((float64, float64, int64, int64, int64))'
+      '(float64, float64, float64, int64, int64, int64, boolean)', cache=True, fastmath=True)
+def _update_after_trade(balance, peak, pnl, wins, total, consec, is_win):
+    """Return (balance, peak, wins, total, consec) after a closed trade"""
+    balance += pnl
+    total += 1
+
+    if balance > peak:
+        peak = balance
+
+    if is_win:
+        wins += 1
+        consec = 0
+    else:
+        consec += 1
+
+    return balance, peak, wins, total, consec
+
+
+@njit('boolean(float64, float64, float64, int64)', cache=True, fastmath=True)
+def _drawdown_stop(peak, balance, max_dd, consec):
+    """Drawdown / losing-streak stop condition"""
+    drawdown = (peak - balance) / peak
+    return drawdown >= max_dd or consec >= 10
+
+
+@njit(cache=True, fastmath=True)
+def _replay_trades(pnls, wins, initial):
+    """Single pass over a trade sequence with running balance/peak/streak"""
+    balance = initial
+    peak = initial
+    max_dd = 0.0
+    n_wins = 0
+    consec = 0
+    max_consec = 0
+
+    for i in range(pnls.size):
+        balance += pnls[i]
+        if balance > peak:
+            peak = balance
+
+        drawdown = (peak - balance) / peak
+        if drawdown > max_dd:
+            max_dd = drawdown
+
+        if wins[i]:
+            n_wins += 1
+            consec = 0
+        else:
+            consec += 1
+            if consec > max_consec:
+                max_consec = consec
+
+    win_rate = n_wins / pnls.size if pnls.size > 0 else 0.0
+    return balance, max_dd, win_rate, max_consec
+
+
+def replay_trades(pnls, wins, initial_balance):
+    """Backtest helper: (final_balance, max_drawdown, win_rate, max_consecutive_losses)"""
+    return _replay_trades(
+        np.ascontiguousarray(pnls, dtype=np.float64),
+        np.ascontiguousarray(wins, dtype=np.bool_),
+        float(initial_balance)
+    )
+
+
+# Prefer the ahead-of-time build (python build_ext.py) to skip JIT warm-up on start
+try:
+    from src.risk_kernels import calc_position_size as _calc_position_size
+    from src.risk_kernels import drawdown_stop as _drawdown_stop
+except ImportError:
+    pass
+
+
 class AdvancedRiskManager:
+    # Hot fields first; no per-instance __dict__
+    __slots__ = (
+        'current_balance', 'peak_balance', 'risk_per_trade', 'risk_amount',
+        'consecutive_losses', 'winning_trades', 'total_trades', 'max_drawdown',
+        '_dirty', '_stop_cached', '_metrics_cached',
+        'initial_balance', 'config', 'logger',
+    )
+    
     def __init__(self, config):
         self.config = config
         risk_config = config.get('risk_management', {})
@@ -13,58 +116,76 @@ class AdvancedRiskManager:
         
         self.risk_per_trade = risk_config.get('risk_per_trade', 0.02)
         self.max_drawdown = risk_config.get('max_drawdown', 0.15)
+        self.risk_amount = self.current_balance * self.risk_per_trade
         
         self.total_trades = 0
         self.winning_trades = 0
         self.consecutive_losses = 0
         
+        # Derived state is recomputed only after update_after_trade
+        self._dirty = True
+        self._stop_cached = False
+        self._metrics_cached = None
+        
         self.logger = logging.getLogger(__name__)
     
     def calculate_position_size(self, entry_price, stop_loss, symbol):
         """Calculate position size based on risk"""
-        risk_amount = self.current_balance * self.risk_per_trade
-        price_risk = abs(entry_price - stop_loss) / entry_price
-        
-        if price_risk == 0:
-            return 0
-            
-        position_value = risk_amount / price_risk
-        position_size = position_value / entry_price
-        
+        return _calc_position_size(
+            self.risk_amount, entry_price, stop_loss, self.consecutive_losses
+        )
+
+    def calculate_position_sizes(self, entry_prices, stop_losses):
+        """Vectorized position sizing for parallel arrays of entries and stops"""
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        stop_losses = np.asarray(stop_losses, dtype=np.float64)
+
+        price_risk = np.abs(entry_prices - stop_losses)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sizes = np.where(price_risk > 0, self.risk_amount / price_risk, 0.0)
+
         # Adjust for consecutive losses
         if self.consecutive_losses >= 3:
-            position_size *= 0.5
-            
-        return position_size
-    
+            sizes *= 0.5
+
+        return sizes
+
     def update_after_trade(self, pnl, is_win):
         """Update after trade"""
-        self.current_balance += pnl
-        self.total_trades += 1
-        
-        if self.current_balance > self.peak_balance:
-            self.peak_balance = self.current_balance
-            
-        if is_win:
-            self.winning_trades += 1
-            self.consecutive_losses = 0
-        else:
-            self.consecutive_losses += 1
+        (self.current_balance, self.peak_balance, self.winning_trades,
+         self.total_trades, self.consecutive_losses) = _update_after_trade(
+            self.current_balance, self.peak_balance, pnl, self.winning_trades,
+            self.total_trades, self.consecutive_losses, bool(is_win)
+        )
+        self.risk_amount = self.current_balance * self.risk_per_trade
+        self._dirty = True
     
     def should_stop_trading(self):
         """Check if should stop trading"""
-        drawdown = (self.peak_balance - self.current_balance) / self.peak_balance
-        return drawdown >= self.max_drawdown or self.consecutive_losses >= 10
+        if self._dirty:
+            self._refresh()
+        return self._stop_cached
     
     def get_performance_metrics(self):
         """Get performance metrics"""
+        if self._dirty:
+            self._refresh()
+        return dict(self._metrics_cached)
+    
+    def _refresh(self):
+        """Recompute stop flag and metrics after a state change"""
+        self._stop_cached = bool(_drawdown_stop(
+            self.peak_balance, self.current_balance, self.max_drawdown, self.consecutive_losses
+        ))
+        
         win_rate = self.winning_trades / self.total_trades if self.total_trades > 0 else 0
         drawdown = (self.peak_balance - self.current_balance) / self.peak_balance
         
-        return {
+        self._metrics_cached = {
             'current_balance': self.current_balance,
             'total_trades': self.total_trades,
             'win_rate': win_rate * 100,
             'consecutive_losses': self.consecutive_losses,
             'drawdown': drawdown * 100
-        }
\ No newline at end of file
+        }
+        self._dirty = False
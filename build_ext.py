@@ -0,0 +1,22 @@
+"""Ahead-of-time build of the risk kernels: python build_ext.py -> src/risk_kernels*.so"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from numba.pycc import CC
+
+# Load the njit kernels even if an older AOT build is already present
+sys.modules['src.risk_kernels'] = None
+import advanced_risk_manager as arm
+
+cc = CC('risk_kernels')
+cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+
+# Same Python sources as the njit kernels, exported with identical signatures
+cc.export('calc_position_size', 'f8(f8, f8, f8, i8)')(arm._calc_position_size.py_func)
+cc.export('drawdown_stop', 'b1(f8, f8, f8, i8)')(arm._drawdown_stop.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built risk_kernels into {cc.output_dir}")
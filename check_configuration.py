@@ -1,9 +1,10 @@
 import os
 import sys
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
 from config.config import Config
 from src.bybit_client import BybitClient
 from src.logger import TradingLogger
@@ -29,22 +30,24 @@ def check_configuration():
             return False
         logger.log("[OK] Подключение к Bybit Testnet успешно", 'info')
     except Exception as e:
-        logger.log(f"[ERROR] Ошибка подключения: {e}", 'error')
+        logger.log("[ERROR] Ошибка подключения: %s", 'error', e)
         return False
     
     # Проверка баланса
     logger.log("3. Проверка баланса...", 'info')
     balance = client.get_account_balance()
-    logger.log(f"[OK] Текущий баланс: {balance} USDT", 'info')
+    logger.log("[OK] Текущий баланс: %s USDT", 'info', balance)
     
     # Проверка торговых пар
     logger.log("4. Проверка торговых пар...", 'info')
-    for symbol in Config.SYMBOLS:
-        price = client.get_current_price(symbol)
+    with ThreadPoolExecutor(max_workers=len(Config.SYMBOLS)) as executor:
+        prices = dict(zip(Config.SYMBOLS, executor.map(client.get_current_price, Config.SYMBOLS)))
+    
+    for symbol, price in prices.items():
         if price:
-            logger.log(f"[OK] {symbol}: {price}", 'info')
+            logger.log("[OK] %s: %s", 'info', symbol, price)
         else:
-            logger.log(f"[WARNING] Не удалось получить цену для {symbol}", 'warning')
+            logger.log("[WARNING] Не удалось получить цену для %s", 'warning', symbol)
     
     # Проверка параметров рисков
     logger.log("5. Проверка параметров рисков...", 'info')
@@ -57,7 +60,7 @@ def check_configuration():
     ]
     
     for param, value in risk_params:
-        logger.log(f"[OK] {param}: {value}", 'info')
+        logger.log("[OK] %s: %s", 'info', param, value)
     
     # Проверка минимальных комиссий
     logger.log("6. Проверка комиссий...", 'info')
@@ -81,22 +84,22 @@ def check_commissions(client, balance, logger):
             # Минимальная прибыль должна покрывать комиссию
             min_profit_to_cover_commission = commission_rate * 2  # вход + выход
             
-            logger.log(f"[INFO] Минимальный размер позиции: {min_position_usdt} USDT", 'info')
-            logger.log(f"[INFO] Комиссия за сделку: {commission_rate*100}%", 'info')
-            logger.log(f"[INFO] Минимальная прибыль для покрытия комиссий: {min_profit_to_cover_commission*100}%", 'info')
+            logger.log("[INFO] Минимальный размер позиции: %s USDT", 'info', min_position_usdt)
+            logger.log("[INFO] Комиссия за сделку: %s%%", 'info', commission_rate*100)
+            logger.log("[INFO] Минимальная прибыль для покрытия комиссий: %s%%", 'info', min_profit_to_cover_commission*100)
             
             # Проверяем, что настройки бота соответствуют
             if Config.MAX_POSITION_SIZE < min_position_usdt:
-                logger.log(f"[WARNING] MAX_POSITION_SIZE ({Config.MAX_POSITION_SIZE}) меньше минимальной позиции!", 'warning')
+                logger.log("[WARNING] MAX_POSITION_SIZE (%s) меньше минимальной позиции!", 'warning', Config.MAX_POSITION_SIZE)
             
             if Config.TAKE_PROFIT_PCT <= min_profit_to_cover_commission:
-                logger.log(f"[CRITICAL] TAKE_PROFIT_PCT ({Config.TAKE_PROFIT_PCT}) не покрывает комиссии!", 'error')
+                logger.log("[CRITICAL] TAKE_PROFIT_PCT (%s) не покрывает комиссии!", 'error', Config.TAKE_PROFIT_PCT)
             
     except Exception as e:
-        logger.log(f"[ERROR] Ошибка при проверке комиссий: {e}", 'error')
+        logger.log("[ERROR] Ошибка при проверке комиссий: %s", 'error', e)
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     if check_configuration():
         print("\n✅ Конфигурация проверена успешно!")
     else:
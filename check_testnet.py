@@ -1,10 +1,10 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 # Добавляем путь к проекту
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
 from config.config import Config
 
 def check_config():
@@ -22,6 +22,6 @@ def check_config():
         print(f"API Key starts with: {Config.BYBIT_API_KEY[:10]}...")
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     check_config()
     
\ No newline at end of file
@@ -1,5 +1,5 @@
 # config/__init__.py
-from .config import Config
+from .config import Config, CFG, PROFILES
 
 class DevelopmentConfig(Config):
     TESTNET = True
@@ -0,0 +1,9 @@
+import functools
+
+from dotenv import load_dotenv
+
+
+@functools.cache
+def load_env():
+    """Читает .env один раз за процесс, повторные вызовы ничего не делают"""
+    return load_dotenv()
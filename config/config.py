@@ -1,9 +1,15 @@
 import os
-from dotenv import load_dotenv
 import json
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
 
-load_dotenv()
+import numpy as np
+
+from ._env import load_env
+
+load_env()
+
+_REASONS = ('OK', 'Неподходящая волатильность', 'Слишком низкий объем')
 
 class Config:
     # API Keys
@@ -54,13 +60,68 @@ class Config:
     
     # Performance Tracking
     SAVE_TRADES = True
-    TRADE_LOG_FILE = 'trades.json'
+    TRADE_LOG_FILE = 'trades.jsonl'  # Одна JSON-строка на сделку
+    PERFORMANCE_LOG_EVERY = 5  # Отчёт о производительности раз в N циклов
     
     @classmethod
     def should_trade(cls, symbol, current_volatility, volume_ratio):
         """Строгие условия для торговли"""
-        if current_volatility < 0.005 or current_volatility > 0.06:
-            return False, "Неподходящая волатильность"
-        if volume_ratio < cls.MIN_VOLUME_RATIO:
-            return False, "Слишком низкий объем"
-        return True, "OK"
\ No newline at end of file
+        bad_volatility = current_volatility < 0.005 or current_volatility > 0.06
+        low_volume = volume_ratio < cls.MIN_VOLUME_RATIO
+        idx = bad_volatility + (low_volume and not bad_volatility) * 2
+        return bool(idx == 0), _REASONS[idx]
+    
+    @classmethod
+    def should_trade_batch(cls, volatilities, volume_ratios):
+        """Векторная версия should_trade для бэктестов: массив bool"""
+        vol = np.asarray(volatilities, dtype=np.float64)
+        vr = np.asarray(volume_ratios, dtype=np.float64)
+        return (vol >= 0.005) & (vol <= 0.06) & (vr >= cls.MIN_VOLUME_RATIO)
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Неизменяемый снимок торговых настроек для горячих путей"""
+    testnet: bool
+    initial_balance: float
+    max_position_size: float
+    risk_per_trade: float
+    symbols: tuple
+    rsi_period: int
+    rsi_oversold: float
+    rsi_overbought: float
+    ema_short: int
+    ema_long: int
+    stop_loss_pct: float
+    take_profit_pct: float
+    max_drawdown: float
+    daily_loss_limit: float
+    max_positions: int
+    min_volume_ratio: float
+    required_confirmations: int
+    min_signal_strength: float
+    use_limit_orders: bool
+    limit_order_price_offset: float
+
+    @classmethod
+    def from_class(cls, config_cls):
+        """Собрать снимок из атрибутов класса Config"""
+        values = {}
+        for field in fields(cls):
+            value = getattr(config_cls, field.name.upper())
+            values[field.name] = tuple(value) if isinstance(value, list) else value
+        return cls(**values)
+
+
+# Именованные профили; активный выбирается переменной окружения DS_PROFILE
+_BASE = _Config.from_class(Config)
+PROFILES = {
+    'sandbox': _BASE,
+    'development': _BASE,
+    'production': replace(_BASE, testnet=False),
+}
+
+_PROFILE = os.getenv('DS_PROFILE', 'sandbox')
+if _PROFILE not in PROFILES:
+    raise ValueError(f"Unknown DS_PROFILE '{_PROFILE}', expected one of: {', '.join(PROFILES)}")
+
+CFG = PROFILES[_PROFILE]
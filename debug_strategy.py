@@ -1,9 +1,11 @@
 # debug_strategy.py
+import math
 import pandas as pd
 import numpy as np
 from config.config import Config
 from src.bybit_client import BybitClient
 from src.data_processor import DataProcessor
+from src.indicators import volume_ratio
 from src.logger import TradingLogger
 
 class DebugStrategy:
@@ -32,7 +34,7 @@ class DebugStrategy:
             # Логируем текущие значения
             self.logger.log(f"  📊 Текущая цена: {current['close']:.4f}", 'info')
             
-            if 'rsi' in df.columns and not np.isnan(current['rsi']):
+            if 'rsi' in df.columns and not math.isnan(current['rsi']):
                 self.logger.log(f"  📈 RSI: {current['rsi']:.2f} (пороги: {Config.RSI_OVERSOLD}/{Config.RSI_OVERBOUGHT})", 'info')
                 
                 # Проверка RSI условий
@@ -44,7 +46,7 @@ class DebugStrategy:
                     self.logger.log(f"  ❌ RSI в нейтральной зоне", 'info')
             
             if 'ema_short' in df.columns and 'ema_long' in df.columns:
-                if not np.isnan(current['ema_short']) and not np.isnan(current['ema_long']):
+                if not math.isnan(current['ema_short']) and not math.isnan(current['ema_long']):
                     self.logger.log(f"  📊 EMA Short: {current['ema_short']:.4f}, EMA Long: {current['ema_long']:.4f}", 'info')
                     
                     # Проверка EMA кросса
@@ -76,11 +78,7 @@ class DebugStrategy:
     
     def _calculate_volume_ratio(self, df):
         """Расчет отношения объема"""
-        if len(df) < 20:
-            return 1.0
-        current_volume = df['volume'].iloc[-1]
-        avg_volume = df['volume'].tail(20).mean()
-        return current_volume / avg_volume if avg_volume > 0 else 1.0
+        return volume_ratio(df['volume'].to_numpy(dtype=np.float64), 20)
 
 def main():
     debug = DebugStrategy()
@@ -1,10 +1,10 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 # Добавляем путь к проекту
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
 from src.bybit_client import BybitClient
 from src.logger import TradingLogger
 
@@ -31,7 +31,7 @@ def diagnostic_test():
         # 3. Тестируем получение баланса
         logger.log("Step 3: Testing balance retrieval...", 'info')
         balance = client.get_account_balance()
-        logger.log(f"Balance result: {balance}", 'info')
+        logger.log("Balance result: %s", 'info', balance)
         
         # 4. Тестируем получение цен
         logger.log("Step 4: Testing price data...", 'info')
@@ -39,16 +39,17 @@ def diagnostic_test():
         for symbol in symbols:
             price = client.get_current_price(symbol)
             if price:
-                logger.log(f"✓ {symbol} price: {price}", 'info')
+                logger.log("✓ %s price: %s", 'info', symbol, price)
             else:
-                logger.log(f"✗ Failed to get price for {symbol}", 'error')
+                logger.log("✗ Failed to get price for %s", 'error', symbol)
         
         # 5. Тестируем исторические данные
         logger.log("Step 5: Testing historical data...", 'info')
         data = client.get_klines('BTCUSDT', limit=5)
         if data is not None:
-            logger.log(f"✓ Historical data: {len(data)} rows", 'info')
-            logger.log(f"Sample data:\n{data[['timestamp', 'close']].head()}", 'info')
+            logger.log("✓ Historical data: %d rows", 'info', len(data))
+            if logger.is_enabled('info'):
+                logger.log("Sample data:\n%s", 'info', data[['timestamp', 'close']].head())
         else:
             logger.log("✗ Failed to get historical data", 'error')
         
@@ -56,11 +57,11 @@ def diagnostic_test():
         return True
         
     except Exception as e:
-        logger.log(f"✗ Diagnostic test failed: {e}", 'error')
+        logger.log("✗ Diagnostic test failed: %s", 'error', e)
         return False
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     success = diagnostic_test()
     if success:
         print("\n🎉 All tests passed! You can now run the main bot.")
@@ -1,144 +1,454 @@
+import math
 import time
+import json
+import queue
+import atexit
 import logging
-import pandas as pd
+import threading
 import numpy as np
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import telegram
 from database import DatabaseManager
 
+try:
+    import orjson
+
+    def _json_line(record):
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _json_line(record):
+        return (json.dumps(record) + '\n').encode()
+
+from config import Config
+from src.numba_compat import njit
+from src.indicators import volume_ratio as _volume_ratio
+
+
+# Running indicator state per symbol, covering closed bars only:
+# EMA numerators/denominators (same values as pandas ewm(span=...).mean()),
+# Wilder gain/loss averages, last close and number of bars folded in.
+_NUM_S, _DEN_S, _NUM_L, _DEN_L, _AVG_GAIN, _AVG_LOSS, _LAST_CLOSE, _COUNT = range(8)
+
+
+@njit(cache=True, nogil=True)
+def _advance(state, close, start, stop, decay_s, decay_l, alpha):
+    """Fold close[start:stop] into the running state in place"""
+    for i in range(start, stop):
+        c = close[i]
+        if state[_COUNT] == 0:
+            state[_NUM_S] = c
+            state[_DEN_S] = 1.0
+            state[_NUM_L] = c
+            state[_DEN_L] = 1.0
+        else:
+            state[_NUM_S] = c + decay_s * state[_NUM_S]
+            state[_DEN_S] = 1.0 + decay_s * state[_DEN_S]
+            state[_NUM_L] = c + decay_l * state[_NUM_L]
+            state[_DEN_L] = 1.0 + decay_l * state[_DEN_L]
+
+            delta = c - state[_LAST_CLOSE]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            state[_AVG_GAIN] += alpha * (gain - state[_AVG_GAIN])
+            state[_AVG_LOSS] += alpha * (loss - state[_AVG_LOSS])
+        state[_LAST_CLOSE] = c
+        state[_COUNT] += 1
+
+
+@njit(cache=True, nogil=True)
+def _indicators(state, price, decay_s, decay_l, alpha, rsi_period):
+    """(ema_s, prev_ema_s, ema_l, prev_ema_l, rsi) with the forming bar at `price` on top of state"""
+    if state[_COUNT] == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+
+    prev_ema_s = state[_NUM_S] / state[_DEN_S]
+    prev_ema_l = state[_NUM_L] / state[_DEN_L]
+    ema_s = (price + decay_s * state[_NUM_S]) / (1.0 + decay_s * state[_DEN_S])
+    ema_l = (price + decay_l * state[_NUM_L]) / (1.0 + decay_l * state[_DEN_L])
+
+    delta = price - state[_LAST_CLOSE]
+    gain = delta if delta > 0 else 0.0
+    loss = -delta if delta < 0 else 0.0
+    avg_gain = state[_AVG_GAIN] + alpha * (gain - state[_AVG_GAIN])
+    avg_loss = state[_AVG_LOSS] + alpha * (loss - state[_AVG_LOSS])
+
+    if state[_COUNT] + 1 < rsi_period:
+        rsi = np.nan
+    elif avg_loss == 0:
+        rsi = 100.0
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return ema_s, prev_ema_s, ema_l, prev_ema_l, rsi
+
+
+def warmup():
+    """Compile the indicator kernels for the column views get_market_data returns"""
+    window = np.ones((2, 6))
+    state = np.zeros(8)
+    _advance(state, window[:, 4], 0, 1, 0.8, 0.9, 1.0 / 14)
+    _indicators(state, 1.0, 0.8, 0.9, 1.0 / 14, 14)
+    _volume_ratio(window[:, 5], 20)
+
+
+_TIMEFRAME_UNITS = {'m': 60, 'h': 3600, 'd': 86400}
+
+
+def timeframe_seconds(timeframe):
+    """'15m' -> 900"""
+    return int(timeframe[:-1]) * _TIMEFRAME_UNITS[timeframe[-1]]
+
+
+class TTLCache:
+    """Minimal expiring key/value cache for exchange responses"""
+
+    def __init__(self):
+        self._data = {}
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+        return None
+
+    def set(self, key, value, ttl=None, expires_at=None):
+        self._data[key] = (expires_at if expires_at is not None else time.time() + ttl, value)
+
+    def invalidate(self, *keys):
+        for key in keys:
+            self._data.pop(key, None)
+
+
+@dataclass(slots=True)
+class Position:
+    symbol: str
+    side: str
+    contracts: float
+
+
+@dataclass(slots=True)
+class Signal:
+    signal: str
+    strength: float
+    rsi: float
+    volume_ratio: float
+    price: float
+
+
 class EnhancedTradingBot:
     def __init__(self, exchange, config, symbols):
         self.exchange = exchange
         self.config = config
         self.symbols = symbols
+        
+        # Hot-path settings resolved once; keys missing from the dict fall back to Config
+        def setting(key):
+            return config.get(key, getattr(Config, key))
+        
+        self._ema_s = int(setting('EMA_SHORT'))
+        self._ema_l = int(setting('EMA_LONG'))
+        self._rsi_p = int(setting('RSI_PERIOD'))
+        self._vol_window = 20
+        self._decay_s = 1.0 - 2.0 / (self._ema_s + 1.0)
+        self._decay_l = 1.0 - 2.0 / (self._ema_l + 1.0)
+        self._rsi_alpha = 1.0 / self._rsi_p
+        self._rsi_lo = float(setting('RSI_OVERSOLD'))
+        self._rsi_hi = float(setting('RSI_OVERBOUGHT'))
+        self._min_vol_ratio = float(setting('MIN_VOLUME_RATIO'))
+        self._min_strength = float(setting('MIN_SIGNAL_STRENGTH'))
+        self._max_positions = int(setting('MAX_POSITIONS'))
+        self._risk_per_trade = float(setting('RISK_PER_TRADE'))
+        self._max_position_size = float(setting('MAX_POSITION_SIZE'))
+        self._limit_offset = float(setting('LIMIT_ORDER_PRICE_OFFSET'))
+        self._stop_loss_pct = float(setting('STOP_LOSS_PCT'))
+        self._take_profit_pct = float(setting('TAKE_PROFIT_PCT'))
+        self._use_limit_orders = bool(setting('USE_LIMIT_ORDERS'))
+        
         self.timeframe = '15m'
         self.tick_interval = 30
+        self.ohlcv_limit = 100
+        self.bar_seconds = timeframe_seconds(self.timeframe)
+        # Wake this long after a bar closes so the exchange has published it
+        self.bar_close_lead = 0.5
         self.positions = {}
         self.orders = {}
         
+        # Symbols are fetched and analyzed concurrently; order placement is serialized
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(8, len(symbols))), thread_name_prefix='symbol')
+        self._trade_lock = threading.Lock()
+        
+        # Responses served from memory between refreshes: OHLCV until the current bar
+        # closes, balance for 5 s, positions for 2 s
+        self._cache = TTLCache()
+        self.balance_ttl = 5
+        self.positions_ttl = 2
+        
+        # Per-symbol OHLCV buffers: rows are (timestamp_ms, open, high, low, close, volume).
+        # Capacity is twice the window so new bars are appended without shifting on every tick;
+        # _ts mirrors the timestamp column as int64 and _fetch receives the raw response.
+        self._ohlcv = {}
+        self._ts = {}
+        self._fetch = {}
+        self._head = {}
+        for symbol in symbols:
+            self._alloc_buffers(symbol)
+        # Timestamp of the bar each symbol was last analyzed on
+        self._last_bar = {}
+        # Incremental EMA/RSI state and the timestamp of the last bar folded into it
+        self._ind_state = {}
+        self._ind_ts = {}
+        warmup()
+        
         # Setup logging
         self.logger = logging.getLogger('enhanced_bot')
         
+        # Trade records are written as JSON lines by a background flusher
+        self.trade_log_batch = 64
+        self._trade_log_q = queue.Queue()
+        self.save_trades = False
+        if config.get('SAVE_TRADES'):
+            try:
+                trade_log = open(config['TRADE_LOG_FILE'], 'ab', buffering=1 << 16)
+                threading.Thread(target=self._trade_log_flusher, args=(trade_log,),
+                                 name='trade-log', daemon=True).start()
+                atexit.register(self._trade_log_q.join)
+                self.save_trades = True
+            except Exception as e:
+                self.logger.error("Failed to open trade log: %s", e)
+        
         # Telegram setup
         self.telegram_enabled = bool(config.get('TELEGRAM_BOT_TOKEN') and config.get('TELEGRAM_CHAT_ID'))
         if self.telegram_enabled:
             try:
                 self.telegram_bot = telegram.Bot(token=config['TELEGRAM_BOT_TOKEN'])
                 self.telegram_chat_id = config['TELEGRAM_CHAT_ID']
+                
+                # Alerts are delivered off the trading path; bursts within the
+                # coalesce window go out as one message
+                self.telegram_coalesce_window = 0.2
+                self.telegram_max_batch = 10
+                self._telegram_queue = queue.Queue()
+                threading.Thread(target=self._telegram_worker, name='telegram-alerts', daemon=True).start()
                 self.logger.info("Telegram notifications enabled")
             except Exception as e:
-                self.logger.error(f"Failed to initialize Telegram: {e}")
+                self.logger.error("Failed to initialize Telegram: %s", e)
                 self.telegram_enabled = False
         else:
             self.logger.info("Telegram notifications disabled")
 
     def run(self):
         self.logger.info("Starting Enhanced Trading Bot")
+        next_bar = 0.0  # analyze right away on start
         while True:
             try:
-                self.tick()
-                time.sleep(self.tick_interval)
+                if time.time() >= next_bar:
+                    # Move to the next bar only once every symbol has the new one;
+                    # if the exchange has not published it yet, retry on the next heartbeat
+                    if self.tick():
+                        next_bar = self._next_bar_close()
+                else:
+                    self.heartbeat()
+                # Sleep until the bar closes, waking every tick_interval for the heartbeat
+                wait = next_bar - time.time()
+                time.sleep(min(self.tick_interval, wait) if wait > 0 else self.tick_interval)
             except Exception as e:
-                self.logger.error(f"Error in main loop: {e}")
+                self.logger.error("Error in main loop: %s", e)
                 time.sleep(60)
 
+    def _next_bar_close(self):
+        bar = self.bar_seconds
+        return math.floor(time.time() / bar + 1) * bar + self.bar_close_lead
+
+    def heartbeat(self):
+        """Balance/positions monitoring between bar closes"""
+        self.check_balance()
+        self.get_open_positions()
+
     def tick(self):
+        """One pass over all symbols; True once every symbol has the current bar"""
         self.logger.info("=== Starting New Tick ===")
         
         # Check balance
         balance = self.check_balance()
         if not balance:
-            return
+            return False
             
         # Get open positions
         self.get_open_positions()
         
-        # Analyze each symbol
-        for symbol in self.symbols:
-            try:
-                data = self.get_market_data(symbol)
-                if data is not None and len(data) > 0:
-                    self.analyze_symbol(symbol, data, balance)
-                time.sleep(0.1)  # Rate limiting
-            except Exception as e:
-                self.logger.error(f"Error analyzing {symbol}: {e}")
+        # Open time of the bar that should be forming now
+        bar_open = int(time.time() // self.bar_seconds * self.bar_seconds * 1000)
+        
+        # Fetch + analyze every symbol on the shared pool
+        futures = [self._pool.submit(self._analyze_one, symbol, balance, bar_open) for symbol in self.symbols]
+        return all([future.result() for future in as_completed(futures)])
+
+    def _analyze_one(self, symbol, balance, bar_open=0):
+        """Analyze the symbol once per new bar; returns whether its data reaches bar_open"""
+        try:
+            data = self.get_market_data(symbol)
+            if data is None:
+                return False
+            # Signals are read from closed bars, so they only change once a new bar appears
+            latest_ts = int(data['timestamp'][-1])
+            if self._last_bar.get(symbol) != latest_ts:
+                self._last_bar[symbol] = latest_ts
+                self.analyze_symbol(symbol, data, balance)
+            return latest_ts >= bar_open
+        except Exception as e:
+            self.logger.error("Error analyzing %s: %s", symbol, e)
+            return False
 
     def get_market_data(self, symbol):
+        key = ('ohlcv', symbol, self.timeframe)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
         try:
             # СИНХРОННЫЙ вызов - убрать await
-            data = self.exchange.fetch_ohlcv(symbol, self.timeframe, since=None, limit=100)
+            data = self.exchange.fetch_ohlcv(symbol, self.timeframe, since=None, limit=self.ohlcv_limit)
             if data and len(data) > 0:
-                df = pd.DataFrame(data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                return df
+                window, timestamps = self._store_bars(symbol, data)
+                market_data = {
+                    'timestamp': timestamps,
+                    'open': window[:, 1],
+                    'high': window[:, 2],
+                    'low': window[:, 3],
+                    'close': window[:, 4],
+                    'volume': window[:, 5],
+                }
+                # Valid until the last fetched bar closes
+                last_bar_close = window[-1, 0] / 1000 + self.bar_seconds
+                self._cache.set(key, market_data, expires_at=last_bar_close)
+                return market_data
             return None
         except Exception as e:
-            self.logger.error(f"Error getting market data for {symbol}: {e}")
+            self.logger.error("Error getting market data for %s: %s", symbol, e)
             return None
 
+    def _alloc_buffers(self, symbol):
+        limit = self.ohlcv_limit
+        self._ohlcv[symbol] = np.empty((2 * limit, 6))
+        self._ts[symbol] = np.empty(2 * limit, dtype=np.int64)
+        self._fetch[symbol] = np.empty((limit, 6))
+        self._head[symbol] = 0
+
+    def _store_bars(self, symbol, data):
+        """Merge fetched bars into the symbol buffers; returns views of the latest window and its timestamps"""
+        limit = self.ohlcv_limit
+        if symbol not in self._ohlcv:
+            self._alloc_buffers(symbol)
+        buf = self._ohlcv[symbol]
+        ts = self._ts[symbol]
+        head = self._head[symbol]
+
+        bars = self._fetch[symbol][:len(data)]
+        np.copyto(bars, data)
+
+        # Only bars from the last stored one (still forming) onward are new
+        start = 0
+        if head:
+            start = int(np.searchsorted(bars[:, 0], buf[head - 1, 0]))
+            if start < len(bars) and bars[start, 0] == buf[head - 1, 0]:
+                head -= 1
+            else:
+                # No overlap (gap after downtime) - start over from the fetched window
+                start = 0
+                head = 0
+        new = bars[start:]
+
+        if head + len(new) > len(buf):
+            keep = min(head, limit)
+            buf[:keep] = buf[head - keep:head]
+            ts[:keep] = ts[head - keep:head]
+            head = keep
+
+        buf[head:head + len(new)] = new
+        ts[head:head + len(new)] = new[:, 0]
+        head += len(new)
+        self._head[symbol] = head
+        start = max(0, head - limit)
+        return buf[start:head], ts[start:head]
+
     def check_balance(self):
         try:
             # СИНХРОННЫЙ вызов - убрать await
-            balance = self.exchange.fetch_balance()
+            balance = self._cache.get('balance')
+            if balance is None:
+                balance = self.exchange.fetch_balance()
+                self._cache.set('balance', balance, ttl=self.balance_ttl)
             usdt_balance = balance.get('total', {}).get('USDT', 0)
-            self.logger.info(f"Current USDT balance: {usdt_balance}")
+            self.logger.info("Current USDT balance: %s", usdt_balance)
             return usdt_balance
         except Exception as e:
-            self.logger.error(f"Error checking balance: {e}")
+            self.logger.error("Error checking balance: %s", e)
             return None
 
     def get_open_positions(self):
         try:
             # СИНХРОННЫЙ вызов - убрать await
-            positions = self.exchange.fetch_positions()
+            positions = self._cache.get('positions')
+            if positions is None:
+                positions = self.exchange.fetch_positions()
+                self._cache.set('positions', positions, ttl=self.positions_ttl)
             self.positions = {}
             for pos in positions:
-                if float(pos.get('contracts', 0)) > 0:
+                contracts = float(pos.get('contracts') or 0)
+                if contracts > 0:
                     symbol = pos['symbol']
-                    self.positions[symbol] = pos
-            self.logger.info(f"Open positions: {len(self.positions)}")
+                    self.positions[symbol] = Position(symbol, pos.get('side'), contracts)
+            self.logger.info("Open positions: %s", len(self.positions))
         except Exception as e:
-            self.logger.error(f"Error getting positions: {e}")
+            self.logger.error("Error getting positions: %s", e)
 
     def analyze_symbol(self, symbol, data, balance):
         try:
             # Calculate indicators
-            signals = self.calculate_indicators(data)
+            signals = self.calculate_indicators(symbol, data)
             
-            if signals['signal'] != 'HOLD':
-                self.logger.info(f"{symbol} - Signal: {signals['signal']}, Strength: {signals['strength']:.2f}")
+            if signals.signal != 'HOLD':
+                self.logger.info("%s - Signal: %s, Strength: %.2f", symbol, signals.signal, signals.strength)
                 
                 # Check if we should trade
-                if self.should_trade(symbol, signals, balance):
-                    self.execute_trade(symbol, signals, balance)
+                with self._trade_lock:
+                    if self.should_trade(symbol, signals, balance):
+                        self.execute_trade(symbol, signals, balance)
                     
         except Exception as e:
-            self.logger.error(f"Error analyzing {symbol}: {e}")
+            self.logger.error("Error analyzing %s: %s", symbol, e)
 
-    def calculate_indicators(self, data):
-        df = data.copy()
-        
-        # EMA
-        df['ema_short'] = df['close'].ewm(span=self.config['EMA_SHORT']).mean()
-        df['ema_long'] = df['close'].ewm(span=self.config['EMA_LONG']).mean()
-        
-        # RSI
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.config['RSI_PERIOD']).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.config['RSI_PERIOD']).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
-        
-        # Volume analysis
-        df['volume_sma'] = df['volume'].rolling(window=20).mean()
-        
-        # Generate signals
-        current_rsi = df['rsi'].iloc[-1]
-        prev_ema_short = df['ema_short'].iloc[-2]
-        prev_ema_long = df['ema_long'].iloc[-2]
-        current_ema_short = df['ema_short'].iloc[-1]
-        current_ema_long = df['ema_long'].iloc[-1]
-        volume_ratio = df['volume'].iloc[-1] / df['volume_sma'].iloc[-1] if df['volume_sma'].iloc[-1] > 0 else 1
+    def _update_indicator_state(self, symbol, timestamps, close):
+        """Fold all but the last bar into the symbol state; the last one is evaluated on top of it"""
+        committed = self._ind_ts.get(symbol)
+        start = 0
+        if committed is not None:
+            idx = int(np.searchsorted(timestamps, committed))
+            # Otherwise the window no longer overlaps the state (gap) - warm up again from the batch
+            if idx < len(timestamps) and timestamps[idx] == committed:
+                start = idx + 1
+        if start == 0:
+            self._ind_state[symbol] = np.zeros(8)
+            self._ind_ts[symbol] = None
+        state = self._ind_state[symbol]
+
+        closed = len(close) - 1
+        if closed > start:
+            _advance(state, close, start, closed, self._decay_s, self._decay_l, self._rsi_alpha)
+            self._ind_ts[symbol] = timestamps[closed - 1]
+        return state
+
+    def calculate_indicators(self, symbol, data):
+        # The last row is the bar that has just opened (near-zero volume, price ~ previous close),
+        # so signals compare the last two closed bars; orders still use the latest price
+        close = data['close'][:-1]
+        price = data['close'][-1]
+        state = self._update_indicator_state(symbol, data['timestamp'][:-1], close)
+        current_ema_short, prev_ema_short, current_ema_long, prev_ema_long, current_rsi = _indicators(
+            state, close[-1], self._decay_s, self._decay_l, self._rsi_alpha, self._rsi_p
+        )
+        volume_ratio = _volume_ratio(data['volume'][:-1], self._vol_window)
         
         signal = 'HOLD'
         strength = 0
@@ -148,75 +458,68 @@ class EnhancedTradingBot:
         ema_bearish = current_ema_short < current_ema_long and prev_ema_short >= prev_ema_long
         
         # RSI conditions
-        rsi_oversold = current_rsi < self.config['RSI_OVERSOLD']
-        rsi_overbought = current_rsi > self.config['RSI_OVERBOUGHT']
+        rsi_oversold = current_rsi < self._rsi_lo
+        rsi_overbought = current_rsi > self._rsi_hi
         
-        if ema_bullish and rsi_oversold and volume_ratio > self.config['MIN_VOLUME_RATIO']:
+        if ema_bullish and rsi_oversold and volume_ratio > self._min_vol_ratio:
             signal = 'BUY'
-            strength = (1 - current_rsi / self.config['RSI_OVERSOLD']) * volume_ratio
+            strength = (1 - current_rsi / self._rsi_lo) * volume_ratio
         elif ema_bearish and rsi_overbought:
             signal = 'SELL'
-            strength = (current_rsi / self.config['RSI_OVERBOUGHT'] - 1) * volume_ratio
+            strength = (current_rsi / self._rsi_hi - 1) * volume_ratio
             
-        return {
-            'signal': signal,
-            'strength': strength,
-            'rsi': current_rsi,
-            'volume_ratio': volume_ratio,
-            'price': df['close'].iloc[-1]
-        }
+        return Signal(signal, strength, current_rsi, volume_ratio, price)
 
     def should_trade(self, symbol, signals, balance):
         # Check signal strength
-        if signals['strength'] < self.config['MIN_SIGNAL_STRENGTH']:
+        if signals.strength < self._min_strength:
             return False
             
         # Check max positions
-        if len(self.positions) >= self.config['MAX_POSITIONS'] and symbol not in self.positions:
+        if len(self.positions) >= self._max_positions and symbol not in self.positions:
             return False
             
         # Check if already in position
         if symbol in self.positions:
-            current_side = self.positions[symbol].get('side')
-            if current_side == 'long' and signals['signal'] == 'BUY':
+            current_side = self.positions[symbol].side
+            if current_side == 'long' and signals.signal == 'BUY':
                 return False
-            if current_side == 'short' and signals['signal'] == 'SELL':
+            if current_side == 'short' and signals.signal == 'SELL':
                 return False
                 
         return True
 
     def execute_trade(self, symbol, signals, balance):
         try:
-            price = signals['price']
-            risk_amount = balance * self.config['RISK_PER_TRADE']
+            price = signals.price
+            risk_amount = balance * self._risk_per_trade
             position_size = risk_amount / price
             
             # Apply position size limits
-            max_size = self.config['MAX_POSITION_SIZE']
-            position_size = min(position_size, max_size)
+            position_size = min(position_size, self._max_position_size)
             
-            if signals['signal'] == 'BUY':
+            if signals.signal == 'BUY':
                 self.place_order(symbol, 'buy', position_size, price)
-            elif signals['signal'] == 'SELL':
+            elif signals.signal == 'SELL':
                 self.place_order(symbol, 'sell', position_size, price)
                 
         except Exception as e:
-            self.logger.error(f"Error executing trade for {symbol}: {e}")
+            self.logger.error("Error executing trade for %s: %s", symbol, e)
 
     def place_order(self, symbol, side, quantity, price):
         try:
             # Calculate order parameters
             if side == 'buy':
-                order_price = price * (1 - self.config['LIMIT_ORDER_PRICE_OFFSET'])
-                stop_loss = order_price * (1 - self.config['STOP_LOSS_PCT'])
-                take_profit = order_price * (1 + self.config['TAKE_PROFIT_PCT'])
+                order_price = price * (1 - self._limit_offset)
+                stop_loss = order_price * (1 - self._stop_loss_pct)
+                take_profit = order_price * (1 + self._take_profit_pct)
             else:
-                order_price = price * (1 + self.config['LIMIT_ORDER_PRICE_OFFSET'])
-                stop_loss = order_price * (1 + self.config['STOP_LOSS_PCT'])
-                take_profit = order_price * (1 - self.config['TAKE_PROFIT_PCT'])
+                order_price = price * (1 + self._limit_offset)
+                stop_loss = order_price * (1 + self._stop_loss_pct)
+                take_profit = order_price * (1 - self._take_profit_pct)
             
             # Place limit order
-            if self.config['USE_LIMIT_ORDERS']:
+            if self._use_limit_orders:
                 # СИНХРОННЫЙ вызов - убрать await
                 order = self.exchange.create_order(
                     symbol, 
@@ -234,7 +537,8 @@ class EnhancedTradingBot:
                     quantity
                 )
             
-            self.logger.info(f"Placed {side} order for {quantity} {symbol} at {order_price}")
+            self.logger.info("Placed %s order for %s %s at %s", side, quantity, symbol, order_price)
+            self._cache.invalidate('balance', 'positions')
             
             # Log the trade
             self.log_trade(symbol, side, quantity, price, order['id'])
@@ -244,10 +548,10 @@ class EnhancedTradingBot:
             self.send_telegram_alert(message)
             
         except Exception as e:
-            self.logger.error(f"Error placing order for {symbol}: {e}")
+            self.logger.error("Error placing order for %s: %s", symbol, e)
 
     def log_trade(self, symbol, side, quantity, price, order_id):
-        if self.config['SAVE_TRADES']:
+        if self.save_trades:
             try:
                 trade_data = {
                     'timestamp': datetime.now().isoformat(),
@@ -258,20 +562,51 @@ class EnhancedTradingBot:
                     'order_id': order_id
                 }
                 
-                # Save to file
-                with open(self.config['TRADE_LOG_FILE'], 'a') as f:
-                    f.write(f"{trade_data}\n")
+                self._trade_log_q.put_nowait(trade_data)
                     
             except Exception as e:
-                self.logger.error(f"Error logging trade: {e}")
+                self.logger.error("Error logging trade: %s", e)
+
+    def _trade_log_flusher(self, f):
+        with f:
+            while True:
+                batch = [self._trade_log_q.get()]
+                while len(batch) < self.trade_log_batch:
+                    try:
+                        batch.append(self._trade_log_q.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                try:
+                    f.write(b''.join(map(_json_line, batch)))
+                    f.flush()
+                except Exception as e:
+                    self.logger.error("Error logging trade: %s", e)
+                finally:
+                    for _ in batch:
+                        self._trade_log_q.task_done()
 
     def send_telegram_alert(self, message):
         if self.telegram_enabled:
+            self._telegram_queue.put_nowait(message)
+
+    def _telegram_worker(self):
+        while True:
+            batch = [self._telegram_queue.get()]
+            deadline = time.monotonic() + self.telegram_coalesce_window
+            while len(batch) < self.telegram_max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._telegram_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
             try:
-                # СИНХРОННЫЙ вызов для Telegram
                 self.telegram_bot.send_message(
                     chat_id=self.telegram_chat_id, 
-                    text=message
+                    text='\n---\n'.join(batch)
                 )
             except Exception as e:
-                self.logger.error(f"Failed to send Telegram alert: {e}")
\ No newline at end of file
+                self.logger.error("Failed to send Telegram alert: %s", e)
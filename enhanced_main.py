@@ -3,8 +3,12 @@
 Enhanced Main Entry Point for DStrade Bot - Final Version
 """
 
-import time
+import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+import ssl
 import sys
 import os
 from pathlib import Path
@@ -18,12 +22,12 @@ sys.path.insert(0, str(root_dir))
 # Import required modules
 try:
     from config import Config
-    import ccxt
+    import aiohttp
+    import certifi
+    import ccxt.async_support as ccxta
     
-    # Import enhanced modules
-    from advanced_risk_manager import AdvancedRiskManager
-    from enhanced_ml_strategy import EnhancedMLStrategy
-    from enhanced_bot import EnhancedTradingBot
+    # Import enhanced modules (async bot: awaits every exchange call)
+    from src.trading.enhanced_bot import EnhancedTradingBot
     
     print("✅ All imports successful")
     
@@ -32,12 +36,35 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Config attribute -> launcher config key
+_REMAP = {
+    'SYMBOLS': 'symbols',
+    'INITIAL_BALANCE': 'initial_balance',
+    'TESTNET': 'testnet',
+    'BYBIT_API_KEY': 'api_key',
+    'BYBIT_API_SECRET': 'api_secret',
+}
+
+
+def make_http_session(limit=100, keepalive_timeout=30):
+    """Keep-alive aiohttp session with a large connection pool for the async ccxt client"""
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        keepalive_timeout=keepalive_timeout,
+        ssl=ssl.create_default_context(cafile=certifi.where()),
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
 class EnhancedBotLauncher:
-    def __init__(self, testnet=True, log_level="INFO"):
+    def __init__(self, testnet=True, log_level="INFO", symbols=None):
         self.testnet = testnet
         self.log_level = log_level
+        self.symbols = symbols
         self.config = {}
         self.exchange = None
+        self.http_session = None
         self.db_manager = None
         self.bot = None
         
@@ -53,9 +80,12 @@ class EnhancedBotLauncher:
             'data/backtest_results'
         ]
         
-        for directory in directories:
+        # Only missing directories are created; one console line for the batch
+        missing = [d for d in directories if not os.path.isdir(d)]
+        for directory in missing:
             os.makedirs(directory, exist_ok=True)
-            print(f"✅ Created directory: {directory}")
+        if missing:
+            print(f"✅ Created directories: {', '.join(missing)}")
             
     def setup_logging(self):
         """Setup comprehensive logging"""
@@ -73,11 +103,18 @@ class EnhancedBotLauncher:
         console_handler.setLevel(log_level)
         console_handler.setFormatter(logging.Formatter(log_format))
         
+        # File/console writes happen on a listener thread; callers only enqueue
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
         # Configure root logger
         logging.basicConfig(
             level=log_level,
-            format=log_format,
-            handlers=[file_handler, console_handler]
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         
         self.logger = logging.getLogger(__name__)
@@ -88,28 +125,18 @@ class EnhancedBotLauncher:
         try:
             config_obj = Config()
             
-            # Extract all uppercase attributes from the config object
-            config_dict = {}
-            for attr in dir(config_obj):
-                if not attr.startswith('_') and attr.isupper():
-                    value = getattr(config_obj, attr)
-                    config_dict[attr] = value
+            # Uppercase settings: class-level constants, then any instance overrides
+            config_dict = {k: v for k, v in vars(type(config_obj)).items() if k[0].isupper()}
+            config_dict.update((k, v) for k, v in vars(config_obj).items() if k[0].isupper())
             
             self.config = config_dict
-            self.logger.info(f"Loaded config with keys: {list(self.config.keys())}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Loaded config with keys: %s", list(self.config))
             
             # Map old config keys to new structure if needed
-            # For example, convert SYMBOLS to symbols, etc.
-            if 'SYMBOLS' in self.config and 'symbols' not in self.config:
-                self.config['symbols'] = self.config['SYMBOLS']
-            if 'INITIAL_BALANCE' in self.config and 'initial_balance' not in self.config:
-                self.config['initial_balance'] = self.config['INITIAL_BALANCE']
-            if 'TESTNET' in self.config and 'testnet' not in self.config:
-                self.config['testnet'] = self.config['TESTNET']
-            if 'BYBIT_API_KEY' in self.config and 'api_key' not in self.config:
-                self.config['api_key'] = self.config['BYBIT_API_KEY']
-            if 'BYBIT_API_SECRET' in self.config and 'api_secret' not in self.config:
-                self.config['api_secret'] = self.config['BYBIT_API_SECRET']
+            for old_key, new_key in _REMAP.items():
+                if old_key in self.config and new_key not in self.config:
+                    self.config[new_key] = self.config[old_key]
             
             # Enhance with additional settings for improved trading
             enhanced_settings = {
@@ -169,6 +196,9 @@ class EnhancedBotLauncher:
             # Ensure critical settings
             self.config['testnet'] = self.testnet
             
+            if self.symbols:
+                self.config['symbols'] = list(self.symbols)
+            
             if 'symbols' not in self.config:
                 self.config['symbols'] = ['BTC/USDT', 'ETH/USDT']
                 
@@ -184,7 +214,7 @@ class EnhancedBotLauncher:
             self.logger.info("Configuration loaded and enhanced successfully")
             
         except Exception as e:
-            self.logger.error(f"Error loading configuration: {e}")
+            self.logger.error("Error loading configuration: %s", e)
             # Create minimal config as fallback
             self.config = {
                 'symbols': ['BTC/USDT', 'ETH/USDT'],
@@ -197,45 +227,56 @@ class EnhancedBotLauncher:
                 'execution': {'tick_interval': 30}
             }
             self.logger.info("Using fallback minimal config")
+        
+        # Section read repeatedly later, looked up once here
+        self._exec_cfg = self.config.get('execution', {})
             
-    def initialize_exchange(self):
+    async def initialize_exchange(self):
         """Initialize exchange connection"""
         try:
             # Get API credentials
             api_key = self.config.get('api_key', 'testnet_key')
             api_secret = self.config.get('api_secret', 'testnet_secret')
             
+            # Reuse warm TCP/TLS connections across all REST calls
+            self.http_session = make_http_session()
+            
             exchange_config = {
                 'apiKey': api_key,
                 'secret': api_secret,
                 'testnet': self.testnet,
                 'sandbox': self.testnet,
                 'enableRateLimit': True,
+                'session': self.http_session,
+                'headers': {
+                    'Connection': 'keep-alive',
+                    'Keep-Alive': 'timeout=30, max=100',
+                },
             }
             
             # Initialize exchange
-            self.exchange = ccxt.bybit(exchange_config)
+            self.exchange = ccxta.bybit(exchange_config)
             
             # Set exchange options
             self.exchange.options['defaultType'] = 'spot'  # or 'future'
             
             self.logger.info("Exchange connection initialized successfully")
             
-            # Test connection (non-blocking)
-            asyncio.create_task(self.test_exchange_connection())
+            await self.test_exchange_connection()
             
         except Exception as e:
-            self.logger.error(f"Error initializing exchange: {e}")
+            self.logger.error("Error initializing exchange: %s", e)
             raise
             
     async def test_exchange_connection(self):
         """Test exchange connection"""
         try:
+            await self.exchange.load_markets()
             # Fetch balance to test connection
             balance = await self.exchange.fetch_balance()
-            self.logger.info(f"Exchange test successful. Total balance: {balance.get('total', {})}")
+            self.logger.info("Exchange test successful. Total balance: %s", balance.get('total', {}))
         except Exception as e:
-            self.logger.warning(f"Exchange test failed: {e}. This might be normal for testnet.")
+            self.logger.warning("Exchange test failed: %s. This might be normal for testnet.", e)
             
     def initialize_database(self):
         """Initialize database connection - placeholder for future use"""
@@ -252,28 +293,31 @@ class EnhancedBotLauncher:
             )
             self.logger.info("Enhanced trading bot initialized successfully")
         except Exception as e:
-            self.logger.error(f"Error initializing bot: {e}")
+            self.logger.error("Error initializing bot: %s", e)
             raise
             
     def print_startup_info(self):
         """Print startup information"""
-        print("\n" + "="*60)
-        print("🚀 ENHANCED DSTRADE BOT - STARTING")
-        print("="*60)
-        print(f"📅 Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"🔧 Mode: {'TESTNET' if self.testnet else 'MAINNET'}")
-        print(f"📊 Log Level: {self.log_level}")
-        print(f"💰 Initial Balance: {self.config.get('initial_balance', 'N/A')}")
-        
         symbols = self.config.get('symbols', [])
         if isinstance(symbols, list) and symbols:
-            print(f"🎯 Trading Symbols: {', '.join(symbols[:3])}{'...' if len(symbols) > 3 else ''}")
+            symbol_text = f"{', '.join(symbols[:3])}{'...' if len(symbols) > 3 else ''}"
         else:
-            print(f"🎯 Trading Symbols: {symbols}")
-            
-        print(f"⏰ Tick Interval: {self.config.get('execution', {}).get('tick_interval', 30)}s")
-        print("="*60)
-        print()
+            symbol_text = symbols
+        
+        # One write for the whole banner instead of a print() per line
+        sys.stdout.write(
+            f"\n{'=' * 60}\n"
+            "🚀 ENHANCED DSTRADE BOT - STARTING\n"
+            f"{'=' * 60}\n"
+            f"📅 Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"🔧 Mode: {'TESTNET' if self.testnet else 'MAINNET'}\n"
+            f"📊 Log Level: {self.log_level}\n"
+            f"💰 Initial Balance: {self.config.get('initial_balance', 'N/A')}\n"
+            f"🎯 Trading Symbols: {symbol_text}\n"
+            f"⏰ Tick Interval: {self._exec_cfg.get('tick_interval', 30)}s\n"
+            f"{'=' * 60}\n\n"
+        )
+        sys.stdout.flush()
         
     async def run(self):
         """Main execution method"""
@@ -281,7 +325,7 @@ class EnhancedBotLauncher:
             # Initialize components in correct order
             self.load_configuration()
             self.print_startup_info()
-            self.initialize_exchange()
+            await self.initialize_exchange()
             self.initialize_database()
             self.initialize_bot()
             
@@ -292,7 +336,7 @@ class EnhancedBotLauncher:
         except KeyboardInterrupt:
             self.logger.info("Bot stopped by user (Ctrl+C)")
         except Exception as e:
-            self.logger.error(f"Bot stopped with error: {e}")
+            self.logger.error("Bot stopped with error: %s", e)
             import traceback
             self.logger.error(traceback.format_exc())
         finally:
@@ -308,11 +352,15 @@ class EnhancedBotLauncher:
                 
             if hasattr(self, 'exchange') and self.exchange:
                 await self.exchange.close()
+            
+            # Passed in via config, so ccxt does not close it itself
+            if self.http_session:
+                await self.http_session.close()
                 
             self.logger.info("Cleanup completed successfully")
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
 
 
 def parse_arguments():
@@ -349,15 +397,20 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def main():
-# Test exchange connection - СИНХРОННЫЙ вызов
-    try:
-        exchange.fetch_balance()  # Убрать await
-        logger.info("Exchange connection initialized successfully")
-    except Exception as e:
-        logger.warning(f"Exchange test failed: {e}. This might be normal for testnet.")
+async def main():
+    """Main entry point"""
+    args = parse_arguments()
+    
+    launcher = EnhancedBotLauncher(
+        testnet=not args.mainnet,
+        log_level=args.log_level,
+        symbols=args.symbols
+    )
+    await launcher.run()
 
 
-# Уберите asyncio.run()
 if __name__ == "__main__":
-    main()  # Просто вызываем main()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 Enhanced bot shutdown complete")
@@ -4,10 +4,17 @@ Enhanced Main Entry Point for DStrade Bot - FIXED VERSION
 """
 
 import asyncio
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
+import queue
+import time
 import sys
 import os
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 import argparse
 
@@ -32,6 +39,145 @@ except ImportError as e:
     sys.exit(1)
 
 
+_log = logging.getLogger(__name__)
+
+# Defaults filled into the Config values; read-only, sections are copied only where inserted
+_ENHANCED_DEFAULTS = MappingProxyType({
+    'risk_management': {
+        'risk_per_trade': 0.02,
+        'max_daily_loss': 0.05,
+        'max_drawdown': 0.15,
+        'dynamic_position_sizing': True,
+        'aggressiveness_adjustment': True,
+        'max_consecutive_losses': 10
+    },
+    'enhanced_strategy': {
+        'min_confidence': 0.6,
+        'use_ml': True,
+        'max_open_positions': 3,
+        'technical_indicators': {
+            'rsi_period': 14,
+            'macd_fast': 12,
+            'macd_slow': 26,
+            'macd_signal': 9,
+            'bb_period': 20,
+            'atr_period': 14,
+            'ema_short': 20,
+            'ema_long': 50
+        }
+    },
+    'performance_monitoring': {
+        'track_metrics': True,
+        'save_trade_history': True,
+        'generate_reports': True,
+        'report_interval': 1
+    },
+    'execution': {
+        'tick_interval': 30,
+        'order_timeout': 30,
+        'max_retries': 3,
+        'slippage': 0.001
+    }
+})
+
+
+@functools.cache
+def _config_to_dict(config_cls):
+    """Extract a settings dict from a Config class, trying the known layouts in turn"""
+    config_obj = config_cls()
+    _log.info("Config object type: %s", type(config_obj))
+    
+    # Method 1: Check if it's already a dictionary
+    if isinstance(config_obj, dict):
+        _log.info("Config is already a dictionary")
+        return config_obj
+        
+    # Method 2: Check for get_config method
+    if hasattr(config_obj, 'get_config') and callable(getattr(config_obj, 'get_config')):
+        _log.info("Used get_config() method")
+        return config_obj.get_config()
+        
+    # Method 3: Check for config attribute
+    if hasattr(config_obj, 'config'):
+        _log.info("Used config attribute")
+        return config_obj.config
+        
+    # Method 4: Convert object to dict using vars()
+    try:
+        config_dict = vars(config_obj)
+        _log.info("Used vars() to convert object to dict")
+        return config_dict
+    except TypeError:
+        # Method 5: Create minimal config
+        _log.warning("Using minimal default config")
+        return {
+            'symbols': ['BTC/USDT', 'ETH/USDT'],
+            'initial_balance': 1000,
+            'testnet': True,
+            'api_key': 'testnet_key',
+            'api_secret': 'testnet_secret'
+        }
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """Log file behind a 64 KiB buffer: written out when full, on WARNING+ or on flush()"""
+
+    def __init__(self, filename, buffer_size=64 * 1024):
+        super().__init__(open(filename, 'a', buffering=buffer_size, encoding='utf-8'))
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        with self.lock:
+            try:
+                self.flush()
+                self.stream.close()
+            finally:
+                super().close()
+
+
+class TimedFlushQueueListener(logging.handlers.QueueListener):
+    """Flushes the handlers from the listener thread at most flush_interval seconds after a buffered write"""
+
+    def __init__(self, log_queue, *handlers, flush_interval=5.0, respect_handler_level=False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        # Monotonic deadline of the pending flush; None while nothing is buffered
+        self._flush_due = None
+
+    def dequeue(self, block):
+        while True:
+            timeout = None if self._flush_due is None else max(0.0, self._flush_due - time.monotonic())
+            try:
+                record = self.queue.get(block, timeout)
+            except queue.Empty:
+                # Quiet period: write out what is buffered and wait for the next record
+                self._flush()
+                continue
+            if self._flush_due is None:
+                self._flush_due = time.monotonic() + self.flush_interval
+            elif time.monotonic() >= self._flush_due:
+                # Steady stream never times out - flush on the deadline anyway
+                self._flush()
+                self._flush_due = time.monotonic() + self.flush_interval
+            return record
+
+    def stop(self):
+        super().stop()
+        self._flush()
+
+    def _flush(self):
+        self._flush_due = None
+        for handler in self.handlers:
+            handler.flush()
+
+
 class EnhancedBotLauncher:
     def __init__(self, testnet=True, log_level="INFO"):
         self.testnet = testnet
@@ -40,6 +186,7 @@ class EnhancedBotLauncher:
         self.exchange = None
         self.db_manager = None
         self.bot = None
+        self.log_flush_interval = 5  # seconds
         
         self.setup_directories()
         self.setup_logging()
@@ -53,9 +200,12 @@ class EnhancedBotLauncher:
             'data/backtest_results'
         ]
         
-        for directory in directories:
+        # Only missing directories are created; one console line for the batch
+        missing = [d for d in directories if not os.path.isdir(d)]
+        for directory in missing:
             os.makedirs(directory, exist_ok=True)
-            print(f"✅ Created directory: {directory}")
+        if missing:
+            print(f"✅ Created directories: {', '.join(missing)}")
             
     def setup_logging(self):
         """Setup comprehensive logging"""
@@ -64,7 +214,7 @@ class EnhancedBotLauncher:
         
         # File handler
         log_filename = f"logs/enhanced_bot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_filename)
         file_handler.setLevel(log_level)
         file_handler.setFormatter(logging.Formatter(log_format))
         
@@ -73,105 +223,51 @@ class EnhancedBotLauncher:
         console_handler.setLevel(log_level)
         console_handler.setFormatter(logging.Formatter(log_format))
         
+        # File/console writes happen on a listener thread; the event loop only enqueues.
+        # The listener also flushes the file buffer on a time bound: the bot's main loop is
+        # synchronous and never yields, so nothing on the event loop could do it
+        log_queue = queue.Queue(-1)
+        self._log_listener = TimedFlushQueueListener(
+            log_queue, file_handler, console_handler,
+            flush_interval=self.log_flush_interval, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._stop_log_listener)
+        
         # Configure root logger
         logging.basicConfig(
             level=log_level,
-            format=log_format,
-            handlers=[file_handler, console_handler]
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         
         self.logger = logging.getLogger(__name__)
         self.logger.info("Enhanced bot logging setup complete")
         
+    def _stop_log_listener(self):
+        """Drain queued records and stop the listener thread (idempotent)"""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+        
     def load_configuration(self):
         """Load and enhance configuration - FIXED VERSION"""
         try:
-            # Get config from your Config class
-            config_obj = Config()
-            self.logger.info(f"Config object type: {type(config_obj)}")
-            
-            # Try different methods to extract config
-            config_dict = {}
-            
-            # Method 1: Check if it's already a dictionary
-            if isinstance(config_obj, dict):
-                config_dict = config_obj
-                self.logger.info("Config is already a dictionary")
-                
-            # Method 2: Check for get_config method
-            elif hasattr(config_obj, 'get_config') and callable(getattr(config_obj, 'get_config')):
-                config_dict = config_obj.get_config()
-                self.logger.info("Used get_config() method")
-                
-            # Method 3: Check for config attribute
-            elif hasattr(config_obj, 'config'):
-                config_dict = config_obj.config
-                self.logger.info("Used config attribute")
-                
-            # Method 4: Convert object to dict using vars()
-            else:
-                try:
-                    config_dict = vars(config_obj)
-                    self.logger.info("Used vars() to convert object to dict")
-                except:
-                    # Method 5: Create minimal config
-                    config_dict = {
-                        'symbols': ['BTC/USDT', 'ETH/USDT'],
-                        'initial_balance': 1000,
-                        'testnet': True,
-                        'api_key': 'testnet_key',
-                        'api_secret': 'testnet_secret'
-                    }
-                    self.logger.warning("Using minimal default config")
+            # Extracted once per Config class; each load works on its own copy
+            config_dict = copy.deepcopy(_config_to_dict(Config))
             
             self.config = config_dict
-            self.logger.info(f"Loaded config keys: {list(self.config.keys())}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Loaded config keys: %s", list(self.config))
             
-            # Enhance with additional settings
-            enhanced_settings = {
-                'risk_management': {
-                    'risk_per_trade': 0.02,
-                    'max_daily_loss': 0.05,
-                    'max_drawdown': 0.15,
-                    'dynamic_position_sizing': True,
-                    'aggressiveness_adjustment': True,
-                    'max_consecutive_losses': 10
-                },
-                'enhanced_strategy': {
-                    'min_confidence': 0.6,
-                    'use_ml': True,
-                    'max_open_positions': 3,
-                    'technical_indicators': {
-                        'rsi_period': 14,
-                        'macd_fast': 12,
-                        'macd_slow': 26,
-                        'macd_signal': 9,
-                        'bb_period': 20,
-                        'atr_period': 14,
-                        'ema_short': 20,
-                        'ema_long': 50
-                    }
-                },
-                'performance_monitoring': {
-                    'track_metrics': True,
-                    'save_trade_history': True,
-                    'generate_reports': True,
-                    'report_interval': 1
-                },
-                'execution': {
-                    'tick_interval': 30,
-                    'order_timeout': 30,
-                    'max_retries': 3,
-                    'slippage': 0.001
-                }
-            }
-            
-            # Merge enhanced settings
-            for key, value in enhanced_settings.items():
-                if key not in self.config:
-                    self.config[key] = value
-                elif isinstance(value, dict) and isinstance(self.config[key], dict):
-                    self.config[key].update(value)
+            # Fill in missing enhanced settings; values already in the config win
+            for key, section in _ENHANCED_DEFAULTS.items():
+                dst = self.config.get(key)
+                if dst is None:
+                    self.config[key] = copy.deepcopy(section)
+                elif isinstance(dst, dict):
+                    for name, value in section.items():
+                        if name not in dst:
+                            dst[name] = copy.deepcopy(value)
             
             # Ensure critical settings
             self.config['testnet'] = self.testnet
@@ -191,7 +287,7 @@ class EnhancedBotLauncher:
             self.logger.info("Configuration loaded successfully")
             
         except Exception as e:
-            self.logger.error(f"Error loading configuration: {e}")
+            self.logger.error("Error loading configuration: %s", e)
             # Create minimal config as fallback
             self.config = {
                 'symbols': ['BTC/USDT', 'ETH/USDT'],
@@ -204,6 +300,10 @@ class EnhancedBotLauncher:
                 'execution': {'tick_interval': 30}
             }
             self.logger.info("Using fallback minimal config")
+        
+        # Sections read repeatedly later, looked up once here
+        self._exec_cfg = self.config.get('execution', {})
+        self._risk_cfg = self.config.get('risk_management', {})
             
     def initialize_exchange(self):
         """Initialize exchange connection"""
@@ -226,20 +326,18 @@ class EnhancedBotLauncher:
             
             self.logger.info("Exchange connection initialized")
             
-            # Test connection (non-blocking)
-            asyncio.create_task(self.test_exchange_connection())
-            
         except Exception as e:
-            self.logger.error(f"Error initializing exchange: {e}")
+            self.logger.error("Error initializing exchange: %s", e)
             raise
             
     async def test_exchange_connection(self):
         """Test exchange connection"""
         try:
-            balance = await self.exchange.fetch_balance()
-            self.logger.info(f"Exchange test successful. Balance: {balance.get('total', {})}")
+            # Sync ccxt client: keep the round-trip off the event loop
+            balance = await asyncio.to_thread(self.exchange.fetch_balance)
+            self.logger.info("Exchange test successful. Balance: %s", balance.get('total', {}))
         except Exception as e:
-            self.logger.warning(f"Exchange test failed: {e}. Continuing anyway...")
+            self.logger.warning("Exchange test failed: %s. Continuing anyway...", e)
             
     def initialize_database(self):
         """Initialize database connection - placeholder"""
@@ -256,35 +354,37 @@ class EnhancedBotLauncher:
             )
             self.logger.info("Enhanced trading bot initialized")
         except Exception as e:
-            self.logger.error(f"Error initializing bot: {e}")
+            self.logger.error("Error initializing bot: %s", e)
             raise
             
     def print_startup_info(self):
         """Print startup information"""
-        print("\n" + "="*60)
-        print("🚀 ENHANCED DSTRADE BOT - STARTING")
-        print("="*60)
-        print(f"📅 Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"🔧 Mode: {'TESTNET' if self.testnet else 'MAINNET'}")
-        print(f"📊 Log Level: {self.log_level}")
-        print(f"💰 Initial Balance: {self.config.get('initial_balance', 'N/A')}")
-        
         symbols = self.config.get('symbols', [])
         if isinstance(symbols, list) and symbols:
             symbol_text = ', '.join(symbols[:3])
             if len(symbols) > 3:
                 symbol_text += f" ... (+{len(symbols)-3} more)"
-            print(f"🎯 Trading Symbols: {symbol_text}")
         else:
-            print(f"🎯 Trading Symbols: {symbols}")
+            symbol_text = symbols
             
-        tick_interval = self.config.get('execution', {}).get('tick_interval', 30)
-        print(f"⏰ Tick Interval: {tick_interval}s")
+        tick_interval = self._exec_cfg.get('tick_interval', 30)
+        risk_per_trade = self._risk_cfg.get('risk_per_trade', 0.02) * 100
         
-        risk_per_trade = self.config.get('risk_management', {}).get('risk_per_trade', 0.02) * 100
-        print(f"🎯 Risk per Trade: {risk_per_trade:.1f}%")
-        print("="*60)
-        print()
+        # One write for the whole banner instead of a print() per line
+        sys.stdout.write(
+            f"\n{'=' * 60}\n"
+            "🚀 ENHANCED DSTRADE BOT - STARTING\n"
+            f"{'=' * 60}\n"
+            f"📅 Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"🔧 Mode: {'TESTNET' if self.testnet else 'MAINNET'}\n"
+            f"📊 Log Level: {self.log_level}\n"
+            f"💰 Initial Balance: {self.config.get('initial_balance', 'N/A')}\n"
+            f"🎯 Trading Symbols: {symbol_text}\n"
+            f"⏰ Tick Interval: {tick_interval}s\n"
+            f"🎯 Risk per Trade: {risk_per_trade:.1f}%\n"
+            f"{'=' * 60}\n\n"
+        )
+        sys.stdout.flush()
         
     async def run(self):
         """Main execution method"""
@@ -294,7 +394,12 @@ class EnhancedBotLauncher:
             self.print_startup_info()
             self.initialize_exchange()
             self.initialize_database()
-            self.initialize_bot()
+            
+            # Bot construction (kernel warm-up, worker threads) overlaps the balance round-trip
+            await asyncio.gather(
+                self.test_exchange_connection(),
+                asyncio.to_thread(self.initialize_bot)
+            )
             
             # Start the main bot
             self.logger.info("Starting enhanced trading bot main loop...")
@@ -303,7 +408,7 @@ class EnhancedBotLauncher:
         except KeyboardInterrupt:
             self.logger.info("Bot stopped by user (Ctrl+C)")
         except Exception as e:
-            self.logger.error(f"Bot stopped with error: {e}")
+            self.logger.error("Bot stopped with error: %s", e)
             import traceback
             self.logger.error(traceback.format_exc())
         finally:
@@ -323,7 +428,9 @@ class EnhancedBotLauncher:
             self.logger.info("Cleanup completed successfully")
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
+        finally:
+            self._stop_log_listener()
 
 
 def parse_arguments():
@@ -382,7 +489,7 @@ async def main():
     try:
         await launcher.run()
     except Exception as e:
-        logging.error(f"Failed to start enhanced bot: {e}")
+        logging.error("Failed to start enhanced bot: %s", e)
         sys.exit(1)
 
 
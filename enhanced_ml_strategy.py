@@ -1,7 +1,27 @@
-import pandas as pd
 import numpy as np
 import logging
 
+from src.numba_compat import njit
+
+_log = logging.getLogger(__name__)
+
+
+@njit(cache=True, nogil=True)
+def _signal_core(close, volume):
+    """(5-bar price change, 10-bar average volume, last volume)"""
+    n = volume.shape[0]
+    total = 0.0
+    for i in range(n - 10, n):
+        total += volume[i]
+    price_change = (close[-1] - close[-5]) / close[-5]
+    return price_change, total / 10.0, volume[n - 1]
+
+
+def warmup():
+    """Compile the signal kernel for contiguous float64 columns"""
+    _signal_core(np.ones(20), np.ones(20))
+
+
 class EnhancedSignal:
     def __init__(self, symbol, action, confidence, entry_price, stop_loss, take_profit, reason=""):
         self.symbol = symbol
@@ -16,21 +36,27 @@ class EnhancedMLStrategy:
     def __init__(self, config):
         self.config = config
         self.min_confidence = 0.6
-        self.logger = logging.getLogger(__name__)
+        self.logger = _log
+        warmup()
     
     def generate_signal(self, symbol, data):
         """Generate trading signal - simplified version"""
         try:
-            df = data.get('candles', pd.DataFrame())
+            # Candles: DataFrame or dict of OHLCV arrays; columns are read as ndarrays once
+            candles = data.get('candles')
             current_price = data.get('current_price', 0)
             
-            if df.empty or len(df) < 20:
+            if candles is None or len(candles) == 0:
+                return EnhancedSignal(symbol, "HOLD", 0, current_price, 0, 0, "Insufficient data")
+            
+            close = np.asarray(candles['close'], dtype=np.float64)
+            volume = np.asarray(candles['volume'], dtype=np.float64)
+            
+            if len(close) < 20:
                 return EnhancedSignal(symbol, "HOLD", 0, current_price, 0, 0, "Insufficient data")
             
             # Simple RSI strategy for demo
-            price_change = (df['close'].iloc[-1] - df['close'].iloc[-5]) / df['close'].iloc[-5]
-            volume_avg = df['volume'].tail(10).mean()
-            current_volume = df['volume'].iloc[-1]
+            price_change, volume_avg, current_volume = _signal_core(close, volume)
             
             if price_change > 0.01 and current_volume > volume_avg:
                 return EnhancedSignal(symbol, "BUY", 0.7, current_price, 
@@ -1,9 +1,10 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
+
 def final_system_check():
     """Финальная проверка всей системы"""
     print("=== ФИНАЛЬНАЯ ПРОВЕРКА СИСТЕМЫ ===")
@@ -46,7 +47,7 @@ def final_system_check():
         test_symbols = ['SOLUSDT', 'XRPUSDT']
         for symbol in test_symbols:
             info = symbol_info.get_symbol_info(symbol)
-            print(f"✅ {symbol}: min_qty={info['min_order_qty']}, min_value={info['min_order_value']} USDT")
+            print(f"✅ {symbol}: min_qty={info.min_order_qty}, min_value={info.min_order_value} USDT")
     except Exception as e:
         print(f"❌ Ошибка информации о символах: {e}")
         return False
@@ -74,7 +75,7 @@ def final_system_check():
     return True
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     if final_system_check():
         print("\n✅ Система полностью готова к работе!")
     else:
@@ -1,9 +1,10 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
+
 def check_imports():
     """Проверка всех импортов"""
     print("=== ПРОВЕРКА ИМПОРТОВ ===")
@@ -45,5 +46,5 @@ def check_imports():
         print(f"❌ TradingLogger - ERROR: {e}")
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     check_imports()
\ No newline at end of file
@@ -1,9 +1,9 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
 from src.bybit_client import BybitClient
 from src.logger import TradingLogger
 
@@ -26,9 +26,11 @@ def final_test():
         balance = client.get_account_balance()
         logger.log(f"[OK] Balance: {balance} USDT", 'info')
         
-        # Тест цен для всех символов
-        for symbol in ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT']:
-            price = client.get_current_price(symbol)
+        # Тест цен для всех символов (один запрос на все тикеры)
+        symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT']
+        prices = client.get_tickers(symbols)
+        for symbol in symbols:
+            price = prices.get(symbol)
             if price:
                 logger.log(f"[OK] {symbol} price: {price}", 'info')
             else:
@@ -49,7 +51,7 @@ def final_test():
         return False
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     if final_test():
         print("\n" + "="*50)
         print("🎉 ВСЕ ТЕСТЫ ПРОЙДЕНЫ! Бот готов к работе!")
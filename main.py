@@ -1,5 +1,5 @@
 import time
-import schedule
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config.config import Config
 from src.bybit_client import BybitClient
@@ -7,6 +7,7 @@ from src.trading_strategy import TradingStrategy
 from src.risk_manager import RiskManager
 from src.position_manager import PositionManager
 from src.logger import TradingLogger
+from src.scheduler import Scheduler
 
 class ProfessionalTradingBot:
     def __init__(self):
@@ -15,6 +16,9 @@ class ProfessionalTradingBot:
         self.logger = TradingLogger()
         self.position_manager = PositionManager(self.client)
         
+        # Пул для параллельной загрузки свечей: цикл ждёт один RTT, а не N
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(8, len(Config.SYMBOLS))), thread_name_prefix='klines')
+        
         # Проверка подключения
         if not self.client.test_connection():
             raise Exception("Не удалось подключиться к Bybit API")
@@ -33,8 +37,9 @@ class ProfessionalTradingBot:
         }
         
         self.max_simultaneous_positions = 3  # Максимум позиций одновременно
+        self.performance_log_every = Config.PERFORMANCE_LOG_EVERY
         
-        self.logger.log(f"Профессиональный торговый бот инициализирован с балансом: {initial_balance} USDT", 'info', True)
+        self.logger.log(f"Профессиональный торговый бот инициализирован с балансом: {initial_balance} USDT", 'info', send_telegram=True)
     
     def run_trading_cycle(self):
         """Улучшенный торговый цикл"""
@@ -51,18 +56,23 @@ class ProfessionalTradingBot:
                 self.logger.log("Торговля приостановлена по правилам риск-менеджмента", 'warning')
                 return
             
+            # Позиции запрашиваем у биржи один раз за цикл
+            self.position_manager.sync_positions()
+            
             # Мониторинг активных позиций
             self.monitor_active_positions()
             
             # Если достигнут лимит позиций - пропускаем анализ
-            if self.position_manager.get_active_positions_count() >= self.max_simultaneous_positions:
+            if self.position_manager.get_active_positions_count(sync=False) >= self.max_simultaneous_positions:
                 self.logger.log("Достигнут лимит активных позиций", 'info')
                 return
             
             # Анализ и торговля
             trades_executed = self.analyze_and_trade()
             
-            self.log_performance()
+            # Отчёт раз в N циклов; между ними хватает расписания в run()
+            if self.performance_stats['cycles_completed'] % self.performance_log_every == 0:
+                self.log_performance()
             
         except Exception as e:
             self.logger.log(f"Ошибка в торговом цикле: {e}", 'error')
@@ -71,16 +81,27 @@ class ProfessionalTradingBot:
         """Улучшенная логика анализа и торговли"""
         trades_executed = 0
         
-        for symbol in Config.SYMBOLS:
+        # Символы с открытой позицией не анализируем и свечи по ним не грузим
+        symbols = [s for s in Config.SYMBOLS if s not in self.position_manager.active_positions]
+        if not symbols:
+            return trades_executed
+        
+        # Свечи по всем символам параллельно, цены - одним запросом тикеров
+        klines = self._pool.map(self._get_klines, symbols)
+        prices = self.client.get_tickers(symbols)
+        
+        for symbol, df in zip(symbols, klines):
+            # Лимит мог заполниться сделками этого же цикла
+            if self.position_manager.get_active_positions_count(sync=False) >= self.max_simultaneous_positions:
+                break
+            
             try:
-                # Получение данных
-                df = self.client.get_klines(symbol, limit=200)
                 if df is None or len(df) < 50:
                     continue
                 
                 # Анализ
                 signal, details = self.strategy.analyze_symbol(symbol, df)
-                current_price = self.client.get_current_price(symbol)
+                current_price = prices.get(symbol)
                 
                 if signal in ['BUY', 'SELL'] and current_price:
                     # Расчет параметров сделки
@@ -114,7 +135,7 @@ class ProfessionalTradingBot:
                     
                     # Открытие позиции
                     if self.position_manager.open_position(
-                        symbol, signal, position_size, current_price, stop_loss, take_profit
+                        symbol, signal, position_size, current_price, stop_loss, take_profit, sync=False
                     ):
                         trades_executed += 1
                         self.performance_stats['total_trades'] += 1
@@ -128,24 +149,31 @@ class ProfessionalTradingBot:
         
         return trades_executed
     
+    def _get_klines(self, symbol):
+        """Свечи для анализа (выполняется в пуле)"""
+        return self.client.get_klines(symbol, limit=200)
+    
     def monitor_active_positions(self):
         """Мониторинг активных позиций"""
-        for symbol in list(self.position_manager.active_positions.keys()):
+        symbols = list(self.position_manager.active_positions.keys())
+        if not symbols:
+            return
+        
+        # Цены всех открытых позиций одним запросом тикеров
+        prices = self.client.get_tickers(symbols)
+        
+        # Стоп-лоссы и тейк-профиты всех позиций одним векторным сравнением
+        exits = self.position_manager.check_exits(prices)
+        
+        for symbol in symbols:
             try:
-                current_price = self.client.get_current_price(symbol)
+                current_price = prices.get(symbol)
                 if not current_price:
                     continue
                 
-                position = self.position_manager.active_positions[symbol]
-                
-                # Проверка стоп-лосса и тейк-профита
-                if (position['side'] == 'Buy' and current_price <= position['stop_loss']) or \
-                   (position['side'] == 'Sell' and current_price >= position['stop_loss']):
-                    self.position_manager.close_position(symbol, "Stop Loss")
-                
-                elif (position['side'] == 'Buy' and current_price >= position['take_profit']) or \
-                     (position['side'] == 'Sell' and current_price <= position['take_profit']):
-                    self.position_manager.close_position(symbol, "Take Profit")
+                reason = exits.get(symbol)
+                if reason:
+                    self.position_manager.close_position(symbol, reason)
                 
                 # Проверка здоровья позиции
                 self.position_manager.check_position_health(symbol, current_price)
@@ -171,6 +199,7 @@ class ProfessionalTradingBot:
             f"Винрейт: {win_rate:.1f}% | "
             f"Общий PnL: {self.performance_stats['total_pnl']:.2f} USDT | "
             f"Комиссии: {self.performance_stats['total_commission']:.2f} USDT | "
+            f"Нереализованный PnL: {self.position_manager.unrealised_pnl():.2f} USDT | "
             f"Баланс: {self.risk_manager.current_balance:.2f} USDT"
         )
         
@@ -178,11 +207,12 @@ class ProfessionalTradingBot:
     
     def run(self):
         """Запуск бота"""
-        self.logger.log("🚀 ПРОФЕССИОНАЛЬНЫЙ ТОРГОВЫЙ БOT ЗАПУЩЕН!", 'info', True)
+        self.logger.log("🚀 ПРОФЕССИОНАЛЬНЫЙ ТОРГОВЫЙ БOT ЗАПУЩЕН!", 'info', send_telegram=True)
         
         # Настройка расписания
-        schedule.every(2).minutes.do(self.run_trading_cycle)
-        schedule.every(30).minutes.do(self.log_performance)
+        scheduler = Scheduler()
+        scheduler.every(2 * 60, self.run_trading_cycle)
+        scheduler.every(30 * 60, self.log_performance)
         
         # Запуск первого цикла
         self.run_trading_cycle()
@@ -191,10 +221,10 @@ class ProfessionalTradingBot:
         
         while True:
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                scheduler.run_pending()
+                time.sleep(scheduler.idle_seconds())
             except KeyboardInterrupt:
-                self.logger.log("Бот остановлен пользователем", 'info', True)
+                self.logger.log("Бот остановлен пользователем", 'info', send_telegram=True)
                 break
             except Exception as e:
                 self.logger.log(f"Неожиданная ошибка: {e}", 'error')
@@ -206,4 +236,4 @@ if __name__ == "__main__":
         bot.run()
     except Exception as e:
         logger = TradingLogger()
-        logger.log(f"Критическая ошибка запуска: {e}", 'error', True)
\ No newline at end of file
+        logger.log(f"Критическая ошибка запуска: {e}", 'error', send_telegram=True)
\ No newline at end of file
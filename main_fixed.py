@@ -1,11 +1,12 @@
 import time
-import schedule
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config.config import Config
 from src.bybit_client import BybitClient
 from src.trading_strategy import TradingStrategy
 from src.risk_manager import RiskManager
 from src.logger import TradingLogger
+from src.scheduler import Scheduler
 
 class TradingBot:
     def __init__(self):
@@ -13,6 +14,9 @@ class TradingBot:
         self.strategy = TradingStrategy()
         self.logger = TradingLogger()
         
+        # Пул для параллельной загрузки свечей: цикл ждёт один RTT, а не N
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(8, len(Config.SYMBOLS))), thread_name_prefix='klines')
+        
         # Тестируем подключение при инициализации
         if not self.client.test_connection():
             self.logger.log("Failed to connect to Bybit API. Check your API keys and internet connection.", 'error')
@@ -30,8 +34,9 @@ class TradingBot:
             'total_pnl': 0,
             'cycles_completed': 0
         }
+        self.performance_log_every = Config.PERFORMANCE_LOG_EVERY
         
-        self.logger.log(f"Trading bot initialized with balance: {initial_balance} USDT", 'info', True)
+        self.logger.log(f"Trading bot initialized with balance: {initial_balance} USDT", 'info', send_telegram=True)
     
     def run_trading_cycle(self):
         """Основной торговый цикл"""
@@ -49,34 +54,40 @@ class TradingBot:
             if current_balance:
                 self.risk_manager.update_balance(current_balance)
             
+            # Свечи по всем символам параллельно, цены - одним запросом тикеров
+            klines = self._pool.map(self._get_klines, Config.SYMBOLS)
+            prices = self.client.get_tickers(Config.SYMBOLS)
+            
             # Анализ каждого символа
             trades_this_cycle = 0
-            for symbol in Config.SYMBOLS:
-                if self.analyze_and_trade(symbol):
+            for symbol, df in zip(Config.SYMBOLS, klines):
+                if self.analyze_and_trade(symbol, df, prices.get(symbol)):
                     trades_this_cycle += 1
-                
-                # Небольшая пауза между символами
-                time.sleep(1)
+                    
+                    # Небольшая пауза между ордерами
+                    time.sleep(1)
             
-            self.log_performance()
+            # Отчёт раз в N циклов; между ними хватает расписания в run()
+            if self.performance_stats['cycles_completed'] % self.performance_log_every == 0:
+                self.log_performance()
             
             if trades_this_cycle > 0:
-                self.logger.log(f"Executed {trades_this_cycle} trades this cycle", 'info', True)
+                self.logger.log(f"Executed {trades_this_cycle} trades this cycle", 'info', send_telegram=True)
             
         except Exception as e:
             self.logger.log(f"Error in trading cycle: {e}", 'error')
     
-    def analyze_and_trade(self, symbol):
-        """Анализ и выполнение торговых операций для символа"""
+    def _get_klines(self, symbol):
+        """Свечи с увеличенным лимитом (выполняется в пуле)"""
+        return self.client.get_klines(symbol, limit=200)
+    
+    def analyze_and_trade(self, symbol, df, current_price):
+        """Анализ и выполнение торговых операций для символа по уже загруженным данным"""
         try:
-            # Получение данных с увеличенным лимитом
-            df = self.client.get_klines(symbol, limit=200)
             if df is None or len(df) < 50:
                 self.logger.log(f"Not enough data for {symbol}", 'warning')
                 return False
             
-            # Получение текущей цены
-            current_price = self.client.get_current_price(symbol)
             if current_price is None:
                 return False
             
@@ -116,7 +127,7 @@ class TradingBot:
                         self.logger.log(
                             f"Order executed: {side} {position_size:.6f} {symbol} "
                             f"at {current_price:.2f}, SL: {stop_loss:.2f}, TP: {take_profit:.2f}",
-                            'info', True
+                            'info', send_telegram=True
                         )
                         return True
             
@@ -147,11 +158,12 @@ class TradingBot:
     
     def run(self):
         """Запуск бота"""
-        self.logger.log("Trading bot started successfully on BYBIT TESTNET!", 'info', True)
+        self.logger.log("Trading bot started successfully on BYBIT TESTNET!", 'info', send_telegram=True)
         
         # Настройка расписания (реже для тестирования)
-        schedule.every(2).minutes.do(self.run_trading_cycle)  # Каждые 2 минуты
-        schedule.every(1).hours.do(self.log_performance)
+        scheduler = Scheduler()
+        scheduler.every(2 * 60, self.run_trading_cycle)  # Каждые 2 минуты
+        scheduler.every(60 * 60, self.log_performance)
         
         # Первый запуск сразу
         self.run_trading_cycle()
@@ -161,10 +173,10 @@ class TradingBot:
         # Основной цикл
         while True:
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                scheduler.run_pending()
+                time.sleep(scheduler.idle_seconds())
             except KeyboardInterrupt:
-                self.logger.log("Bot stopped by user", 'info', True)
+                self.logger.log("Bot stopped by user", 'info', send_telegram=True)
                 break
             except Exception as e:
                 self.logger.log(f"Unexpected error in main loop: {e}", 'error')
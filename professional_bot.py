@@ -1,5 +1,5 @@
 import time
-import schedule
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config.config import Config
 from src.bybit_client import BybitClient
@@ -8,6 +8,7 @@ from src.position_manager import PositionManager
 from src.risk_manager import RiskManager
 from src.symbol_info import SymbolInfo
 from src.logger import TradingLogger
+from src.scheduler import Scheduler
 
 class ProfessionalTradingBot:
     def __init__(self):
@@ -45,9 +46,10 @@ class ProfessionalTradingBot:
             
             # Обрабатываем символы только если есть свободные слоты
             if active_positions < Config.MAX_POSITIONS:
-                for symbol in Config.SYMBOLS:
-                    if symbol not in self.position_manager.active_positions:
-                        self.process_symbol(symbol, balance)
+                symbols = [s for s in Config.SYMBOLS if s not in self.position_manager.active_positions]
+                klines = self.fetch_klines(symbols)
+                for symbol in symbols:
+                    self.process_symbol(symbol, balance, klines[symbol])
             
             # Логируем статистику
             self.log_statistics(balance, active_positions)
@@ -55,11 +57,19 @@ class ProfessionalTradingBot:
         except Exception as e:
             self.logger.log(f"Ошибка в цикле торговли: {e}", 'error')
     
-    def process_symbol(self, symbol, balance):
+    def fetch_klines(self, symbols):
+        """Параллельная загрузка свечей по всем символам"""
+        if not symbols:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(16, len(symbols))) as executor:
+            return dict(zip(symbols, executor.map(lambda s: self.client.get_klines(s, '15', 100), symbols)))
+    
+    def process_symbol(self, symbol, balance, df=None):
         """Обработка символа"""
         try:
             # Получаем данные
-            df = self.client.get_klines(symbol, '15', 100)
+            if df is None:
+                df = self.client.get_klines(symbol, '15', 100)
             if df is None or len(df) < 50:
                 return
             
@@ -99,14 +109,14 @@ class ProfessionalTradingBot:
             )
             
             # Открываем позицию
-            if self.position_manager.open_position(symbol, signal, quantity, current_price, stop_loss, take_profit):
+            if self.position_manager.open_position(symbol, signal, quantity, current_price, stop_loss, take_profit, sync=False):
                 self.total_trades += 1
                 self.risk_manager.record_trade(symbol, signal, current_price, quantity, stop_loss, take_profit)
                 self.logger.log(
                     f"🎯 СДЕЛКА: {signal} {quantity:.4f} {symbol} | "
                     f"Цена: {current_price:.4f} | Сила: {signal_strength:.1f}",
                     'info', 
-                    True
+                    send_telegram=True
                 )
                 
         except Exception as e:
@@ -127,15 +137,16 @@ def main():
         
         # Тест подключения
         if not bot.client.test_connection():
-            bot.logger.log("Ошибка подключения к API", 'error', True)
+            bot.logger.log("Ошибка подключения к API", 'error', send_telegram=True)
             return
         
-        bot.logger.log("🚀 ТОРГОВЫЙ БОТ ЗАПУЩЕН", 'info', True)
+        bot.logger.log("🚀 ТОРГОВЫЙ БОТ ЗАПУЩЕН", 'info', send_telegram=True)
         bot.logger.log(f"Баланс: {bot.initial_balance} USDT", 'info')
         bot.logger.log(f"Символы: {', '.join(Config.SYMBOLS)}", 'info')
         
         # Запускаем каждые 10 минут
-        schedule.every(3).minutes.do(bot.run_trading_cycle)
+        scheduler = Scheduler()
+        scheduler.every(3 * 60, bot.run_trading_cycle)
         
         # Первый запуск
         bot.run_trading_cycle()
@@ -144,10 +155,10 @@ def main():
         
         while True:
             try:
-                schedule.run_pending()
-                time.sleep(30)
+                scheduler.run_pending()
+                time.sleep(scheduler.idle_seconds())
             except KeyboardInterrupt:
-                bot.logger.log("Бот остановлен", 'info', True)
+                bot.logger.log("Бот остановлен", 'info', send_telegram=True)
                 break
             except Exception as e:
                 bot.logger.log(f"Ошибка: {e}", 'error')
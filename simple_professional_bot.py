@@ -1,10 +1,10 @@
 import time
-import schedule
 from datetime import datetime
 from config.config import Config
 from src.bybit_client import BybitClient
 from src.symbol_info import SymbolInfo
 from src.logger import TradingLogger
+from src.scheduler import Scheduler
 
 class SimpleProfessionalBot:
     def __init__(self):
@@ -32,7 +32,7 @@ class SimpleProfessionalBot:
         # Используем только символы с подходящими условиями
         self.test_symbols = ['SOLUSDT', 'XRPUSDT']
         
-        self.logger.log(f"Упрощенный профессиональный бот инициализирован с балансом: {self.balance} USDT", 'info', True)
+        self.logger.log(f"Упрощенный профессиональный бот инициализирован с балансом: {self.balance} USDT", 'info', send_telegram=True)
     
     def simple_analysis(self, symbol):
         """Простой анализ на основе цены"""
@@ -134,7 +134,7 @@ class SimpleProfessionalBot:
                             self.performance_stats['successful_trades'] += 1
                             order_value = position_size * current_price
                             self.performance_stats['total_volume'] += order_value
-                            self.logger.log(f"Тестовая сделка выполнена: {signal} {position_size} {symbol} (стоимость: {order_value:.2f} USDT)", 'info', True)
+                            self.logger.log(f"Тестовая сделка выполнена: {signal} {position_size} {symbol} (стоимость: {order_value:.2f} USDT)", 'info', send_telegram=True)
                         else:
                             self.performance_stats['total_trades'] += 1
                             self.performance_stats['failed_trades'] += 1
@@ -179,12 +179,13 @@ class SimpleProfessionalBot:
     
     def run(self):
         """Запуск бота"""
-        self.logger.log("🚀 УПРОЩЕННЫЙ ПРОФЕССИОНАЛЬНЫЙ БОТ ЗАПУЩЕН!", 'info', True)
+        self.logger.log("🚀 УПРОЩЕННЫЙ ПРОФЕССИОНАЛЬНЫЙ БОТ ЗАПУЩЕН!", 'info', send_telegram=True)
         self.logger.log(f"Тестовые символы: {', '.join(self.test_symbols)}", 'info')
         self.logger.log(f"Начальный баланс: {self.balance} USDT", 'info')
         
         # Настройка расписания
-        schedule.every(5).minutes.do(self.run_trading_cycle)  # Каждые 5 минут
+        scheduler = Scheduler()
+        scheduler.every(5 * 60, self.run_trading_cycle)  # Каждые 5 минут
         
         # Первый запуск
         self.run_trading_cycle()
@@ -193,10 +194,10 @@ class SimpleProfessionalBot:
         
         while True:
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                scheduler.run_pending()
+                time.sleep(scheduler.idle_seconds())
             except KeyboardInterrupt:
-                self.logger.log("Бот остановлен пользователем", 'info', True)
+                self.logger.log("Бот остановлен пользователем", 'info', send_telegram=True)
                 break
             except Exception as e:
                 self.logger.log(f"Неожиданная ошибка: {e}", 'error')
@@ -208,4 +209,4 @@ if __name__ == "__main__":
         bot.run()
     except Exception as e:
         logger = TradingLogger()
-        logger.log(f"Критическая ошибка запуска: {e}", 'error', True)
\ No newline at end of file
+        logger.log(f"Критическая ошибка запуска: {e}", 'error', send_telegram=True)
\ No newline at end of file
@@ -1,16 +1,27 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import time
 import hmac
 import hashlib
 import json
-from config.config import Config
+import sys
+from config.config import Config, CFG
 from src.logger import TradingLogger
+from src.positions import Positions
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 class BybitClient:
     def __init__(self):
         self.logger = TradingLogger()
-        self.testnet = Config.TESTNET
+        self.testnet = CFG.testnet
         self.base_url = "https://api-testnet.bybit.com" if self.testnet else "https://api.bybit.com"
         self.api_key = Config.BYBIT_API_KEY
         self.api_secret = Config.BYBIT_API_SECRET
@@ -19,6 +30,13 @@ class BybitClient:
             self.logger.log("ERROR: API keys not found in .env file", 'error')
             raise ValueError("API keys not configured")
         
+        # Одна сессия на клиента: keep-alive и пул соединений вместо нового TLS на каждый запрос
+        self.session = requests.Session()
+        # Повторы только при сбоях соединения и только для GET: POST (ордера) Retry не повторяет
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        self.session.mount("https://", adapter)
+        
         self.logger.log("Bybit client initialized successfully", 'info')
     
     def _generate_signature(self, timestamp, recv_window, params=None, method="GET"):
@@ -64,16 +82,16 @@ class BybitClient:
             url = f"{self.base_url}{endpoint}"
             
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response = self.session.get(url, headers=headers, params=params, timeout=10)
             else:
                 headers["Content-Type"] = "application/json"
-                response = requests.post(url, headers=headers, json=params, timeout=10)
+                response = self.session.post(url, headers=headers, json=params, timeout=10)
             
             if response.status_code != 200:
                 self.logger.log(f"API error: Status {response.status_code}, Response: {response.text}", 'error')
                 return None
                 
-            result = response.json()
+            result = _json_loads(response.content)
             
             ret_code = result.get('retCode')
             ret_msg = result.get('retMsg', 'No message')
@@ -117,25 +135,21 @@ class BybitClient:
                 'accountType': 'UNIFIED'
             })
             
-            if response and 'result' in response:
-                balance_list = response['result'].get('list', [])
-                if balance_list and len(balance_list) > 0:
-                    for coin in balance_list[0].get('coin', []):
-                        if coin.get('coin') == 'USDT':
-                            balance = coin.get('availableToWithdraw')
-                            if balance is None or balance == '':
-                                balance = coin.get('availableBalance')
-                            if balance is None or balance == '':
-                                balance = coin.get('walletBalance')
-                            
-                            if balance and balance != '':
-                                try:
-                                    balance_float = float(balance)
-                                    self.logger.log(f"Account balance: {balance_float} USDT", 'info')
-                                    return balance_float
-                                except (ValueError, TypeError) as e:
-                                    self.logger.log(f"Error converting balance '{balance}' to float: {e}", 'error')
-                                    continue
+            try:
+                coins = response['result']['list'][0]['coin']
+            except (KeyError, IndexError, TypeError):
+                coins = []
+            
+            usdt = next((coin for coin in coins if coin.get('coin') == 'USDT'), None)
+            if usdt is not None:
+                balance = usdt.get('availableToWithdraw') or usdt.get('availableBalance') or usdt.get('walletBalance')
+                if balance:
+                    try:
+                        balance_float = float(balance)
+                        self.logger.log(f"Account balance: {balance_float} USDT", 'info')
+                        return balance_float
+                    except (ValueError, TypeError) as e:
+                        self.logger.log(f"Error converting balance '{balance}' to float: {e}", 'error')
             
             self.logger.log("Could not retrieve balance from API, using initial balance", 'warning')
             return Config.INITIAL_BALANCE
@@ -152,19 +166,45 @@ class BybitClient:
                 'symbol': symbol
             })
             
-            if response and 'result' in response and 'list' in response['result']:
-                tickers = response['result']['list']
-                if tickers and len(tickers) > 0:
-                    price = float(tickers[0]['lastPrice'])
-                    return price
-            
-            self.logger.log(f"Could not get price for {symbol}", 'warning')
-            return None
+            try:
+                return float(response['result']['list'][0]['lastPrice'])
+            except (KeyError, IndexError, TypeError):
+                self.logger.log(f"Could not get price for {symbol}", 'warning')
+                return None
             
         except Exception as e:
             self.logger.log(f"Error getting price for {symbol}: {e}", 'error')
             return None
     
+    def get_tickers(self, symbols=None):
+        """Последние цены одним запросом: {symbol: lastPrice}, при symbols - только они"""
+        try:
+            response = self._make_request('GET', '/v5/market/tickers', {
+                'category': 'linear'
+            })
+            
+            try:
+                tickers = response['result']['list']
+            except (KeyError, TypeError):
+                self.logger.log("Could not get tickers", 'warning')
+                return {}
+            
+            wanted = set(symbols) if symbols is not None else None
+            prices = {}
+            for ticker in tickers:
+                symbol = ticker.get('symbol')
+                if wanted is not None and symbol not in wanted:
+                    continue
+                try:
+                    prices[symbol] = float(ticker['lastPrice'])
+                except (KeyError, ValueError, TypeError):
+                    continue
+            return prices
+            
+        except Exception as e:
+            self.logger.log(f"Error getting tickers: {e}", 'error')
+            return {}
+    
     def get_klines(self, symbol, interval='15', limit=100):
         """Получение исторических данных"""
         try:
@@ -175,32 +215,37 @@ class BybitClient:
                 'limit': limit
             })
             
-            if response and 'result' in response and 'list' in response['result']:
+            try:
                 klines = response['result']['list']
-                if not klines:
-                    self.logger.log(f"No kline data for {symbol}", 'warning')
-                    return None
-                
-                df = pd.DataFrame(klines, columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
-                ])
-                
-                df['open'] = pd.to_numeric(df['open'], errors='coerce')
-                df['high'] = pd.to_numeric(df['high'], errors='coerce')
-                df['low'] = pd.to_numeric(df['low'], errors='coerce')
-                df['close'] = pd.to_numeric(df['close'], errors='coerce')
-                df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
-                
-                df = df.dropna()
-                
-                if len(df) < 20:
-                    self.logger.log(f"Not enough data for {symbol}: {len(df)} rows", 'warning')
-                    return None
-                
-                self.logger.log(f"Retrieved {len(df)} klines for {symbol}", 'info')
-                return df
+            except (KeyError, TypeError):
+                return None
             
-            return None
+            if not klines:
+                self.logger.log(f"No kline data for {symbol}", 'warning')
+                return None
+            
+            # Bybit отдает все поля строками - разбираем весь блок сразу в float64
+            try:
+                arr = np.asarray(klines, dtype=np.float64)
+            except ValueError:
+                # Пустые/битые поля: построчный разбор, свечи с NaN отбрасываем
+                arr = pd.DataFrame(klines).apply(pd.to_numeric, errors='coerce').to_numpy(np.float64)
+                arr = arr[~np.isnan(arr).any(axis=1)]
+            
+            # Bybit отдает свечи от новых к старым - разворачиваем по времени
+            arr = arr[np.argsort(arr[:, 0], kind='stable')]
+            
+            df = pd.DataFrame(arr[:, 1:7], columns=['open', 'high', 'low', 'close', 'volume', 'turnover'])
+            df.insert(0, 'timestamp', arr[:, 0].astype(np.int64))
+            
+            df = df.dropna()
+            
+            if len(df) < 20:
+                self.logger.log(f"Not enough data for {symbol}: {len(df)} rows", 'warning')
+                return None
+            
+            self.logger.log(f"Retrieved {len(df)} klines for {symbol}", 'info')
+            return df
             
         except Exception as e:
             self.logger.log(f"Error getting klines for {symbol}: {e}", 'error')
@@ -232,14 +277,14 @@ class BybitClient:
             
             if response and 'result' in response:
                 order_id = response['result'].get('orderId', 'Unknown')
-                self.logger.log(f"Order placed successfully: {bybit_side} {qty} {symbol} (ID: {order_id})", 'info', True)
+                self.logger.log(f"Order placed successfully: {bybit_side} {qty} {symbol} (ID: {order_id})", 'info', send_telegram=True)
                 return response
             else:
-                self.logger.log(f"Order failed for {symbol}", 'error', True)
+                self.logger.log(f"Order failed for {symbol}", 'error', send_telegram=True)
                 return None
                 
         except Exception as e:
-            self.logger.log(f"Error placing order for {symbol}: {e}", 'error', True)
+            self.logger.log(f"Error placing order for {symbol}: {e}", 'error', send_telegram=True)
             return None
     
     def get_open_positions(self):
@@ -250,47 +295,75 @@ class BybitClient:
                 'settleCoin': 'USDT'
             })
             
-            if response and 'result' in response and 'list' in response['result']:
+            try:
                 positions = response['result']['list']
-                active_positions = []
-                
-                for pos in positions:
+            except (KeyError, TypeError):
+                return []
+            
+            active_positions = []
+            
+            # Размеры разбираем одним проходом, дальше работаем только с открытыми слотами
+            try:
+                sizes = np.fromiter((pos.get('size') or 0 for pos in positions), dtype=np.float64, count=len(positions))
+            except (ValueError, TypeError):
+                # Битый size у одной позиции не должен скрывать остальные - разбираем построчно
+                sizes = np.zeros(len(positions))
+                for i, pos in enumerate(positions):
                     try:
-                        # Безопасное преобразование размеров
-                        size_str = pos.get('size', '0')
-                        size = float(size_str) if size_str and size_str != '' else 0.0
-                        
-                        if size > 0:
-                            # Безопасное преобразование цен
-                            avg_price_str = pos.get('avgPrice', '0')
-                            avg_price = float(avg_price_str) if avg_price_str and avg_price_str != '' else 0.0
-                            
-                            leverage_str = pos.get('leverage', '1')
-                            leverage = float(leverage_str) if leverage_str and leverage_str != '' else 1.0
-                            
-                            liq_price_str = pos.get('liqPrice', '0')
-                            liq_price = float(liq_price_str) if liq_price_str and liq_price_str != '' else 0.0
-                            
-                            unrealised_pnl_str = pos.get('unrealisedPnl', '0')
-                            unrealised_pnl = float(unrealised_pnl_str) if unrealised_pnl_str and unrealised_pnl_str != '' else 0.0
-                            
-                            active_positions.append({
-                                'symbol': pos['symbol'],
-                                'side': pos['side'],
-                                'size': size,
-                                'entry_price': avg_price,
-                                'leverage': leverage,
-                                'liq_price': liq_price,
-                                'unrealised_pnl': unrealised_pnl
-                            })
+                        sizes[i] = float(pos.get('size') or 0)
                     except (ValueError, TypeError) as e:
                         self.logger.log(f"Error parsing position data for {pos.get('symbol', 'unknown')}: {e}", 'warning')
-                        continue
-                
-                return active_positions
             
+            for i in np.flatnonzero(sizes > 0):
+                pos = positions[i]
+                size = float(sizes[i])
+                try:
+                    # Безопасное преобразование цен
+                    avg_price_str = pos.get('avgPrice', '0')
+                    avg_price = float(avg_price_str) if avg_price_str and avg_price_str != '' else 0.0
+                    
+                    leverage_str = pos.get('leverage', '1')
+                    leverage = float(leverage_str) if leverage_str and leverage_str != '' else 1.0
+                    
+                    liq_price_str = pos.get('liqPrice', '0')
+                    liq_price = float(liq_price_str) if liq_price_str and liq_price_str != '' else 0.0
+                    
+                    unrealised_pnl_str = pos.get('unrealisedPnl', '0')
+                    unrealised_pnl = float(unrealised_pnl_str) if unrealised_pnl_str and unrealised_pnl_str != '' else 0.0
+                    
+                    active_positions.append({
+                        'symbol': sys.intern(pos['symbol']),
+                        'side': pos['side'],
+                        'size': size,
+                        'entry_price': avg_price,
+                        'leverage': leverage,
+                        'liq_price': liq_price,
+                        'unrealised_pnl': unrealised_pnl
+                    })
+                except (ValueError, TypeError) as e:
+                    self.logger.log(f"Error parsing position data for {pos.get('symbol', 'unknown')}: {e}", 'warning')
+                    continue
+            
+            return active_positions
+            
+        except Exception as e:
+            self.logger.log(f"Error getting positions: {e}", 'error')
             return []
+    
+    def get_positions_snapshot(self):
+        """Открытые позиции в виде столбцов numpy (Positions); None при ошибке API"""
+        try:
+            response = self._make_request('GET', '/v5/position/list', {
+                'category': 'linear',
+                'settleCoin': 'USDT'
+            })
             
+            try:
+                raw_positions = response['result']['list']
+            except (KeyError, TypeError):
+                return None
+            
+            return Positions.from_api(raw_positions)
         except Exception as e:
             self.logger.log(f"Error getting positions: {e}", 'error')
-            return []
\ No newline at end of file
+            return None
@@ -4,23 +4,19 @@ import numpy as np
 from ta.trend import ADXIndicator, IchimokuIndicator
 from ta.momentum import StochasticOscillator
 
+from src.indicators import compute_core_indicators, pct_change, rolling_std
+
 class DataProcessor:
     @staticmethod
     def calculate_technical_indicators(df):
         """Расчет технических индикаторов"""
         try:
-            # RSI
-            df['rsi'] = ta.momentum.RSIIndicator(df['close'], window=14).rsi()
-            
-            # EMA
-            df['ema_short'] = ta.trend.EMAIndicator(df['close'], window=9).ema_indicator()
-            df['ema_long'] = ta.trend.EMAIndicator(df['close'], window=21).ema_indicator()
-            
-            # MACD
-            macd = ta.trend.MACD(df['close'])
-            df['macd'] = macd.macd()
-            df['macd_signal'] = macd.macd_signal()
-            df['macd_hist'] = macd.macd_diff()
+            # RSI, EMA и MACD одним проходом по numpy-массиву (numba-ядра)
+            close = df['close'].to_numpy(dtype=np.float64)
+            (df['rsi'], df['ema_short'], df['ema_long'],
+             df['macd'], df['macd_signal'], df['macd_hist']) = compute_core_indicators(
+                close, rsi_window=14, ema_short=9, ema_long=21
+            )
             
             # Bollinger Bands
             bollinger = ta.volatility.BollingerBands(df['close'], window=20, window_dev=2)
@@ -93,17 +89,35 @@ class DataProcessor:
     def calculate_volatility(df, period=20):
         """Расчет волатильности"""
         try:
-            df['returns'] = df['close'].pct_change()
-            df['volatility'] = df['returns'].rolling(window=period).std()
+            # Доходности и скользящее std без промежуточных Series (numba-ядра)
+            returns = pct_change(df['close'].to_numpy(dtype=np.float64))
+            df['returns'] = returns
+            volatility = rolling_std(returns, period)
+            df['volatility'] = volatility
             
-            # Historical Volatility (годовая)
-            df['hv_20'] = df['returns'].rolling(window=20).std() * np.sqrt(365)
+            # Historical Volatility (годовая); при period=20 окно то же - второй проход не нужен
+            hv_20 = volatility if period == 20 else rolling_std(returns, 20)
+            df['hv_20'] = hv_20 * np.sqrt(365)
             
             return df
         except Exception as e:
             print(f"Error calculating volatility: {e}")
             return df
     
+    @staticmethod
+    def last_volatility(df, period=20):
+        """Волатильность только последнего окна (std доходностей), без rolling по всей серии"""
+        return DataProcessor.last_volatility_of(df['close'].to_numpy(dtype=np.float64, copy=False), period)
+    
+    @staticmethod
+    def last_volatility_of(close, period=20):
+        """last_volatility для уже извлеченного массива цен закрытия"""
+        if close.size < period + 1:
+            return 0.0
+        tail = close[-(period + 1):]
+        returns = np.diff(tail) / tail[:-1]
+        return float(returns.std(ddof=1))
+    
     @staticmethod
     def add_price_features(df):
         """Добавление дополнительных фич цены"""
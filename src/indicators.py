@@ -0,0 +1,155 @@
+"""Numba kernels for the core indicators, numerically matching the `ta` package"""
+import numpy as np
+
+from src.numba_compat import njit
+
+# No fastmath here: the kernels rely on NaN checks (x == x) for warm-up periods.
+# No explicit signatures either: pandas hands out read-only arrays under copy-on-write,
+# and lazy compilation specialises for those as well.
+# nogil: the bots call these from worker threads, which can then run them in parallel.
+
+
+@njit(cache=True, nogil=True)
+def ewm_mean(values, alpha, min_periods):
+    """pandas ewm(alpha=..., adjust=False, min_periods=...).mean() port"""
+    n = values.size
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs >= min_periods else np.nan
+    old_wt = 1.0
+
+    for i in range(1, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs >= min_periods else np.nan
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ema(close, window):
+    """ta.trend.EMAIndicator(close, window).ema_indicator()"""
+    return ewm_mean(close, 2.0 / (window + 1.0), window)
+
+
+@njit(cache=True, nogil=True)
+def rsi(close, window):
+    """ta.momentum.RSIIndicator(close, window).rsi() with Wilder smoothing"""
+    n = close.size
+    up = np.zeros(n)
+    down = np.zeros(n)
+    for i in range(1, n):
+        diff = close[i] - close[i - 1]
+        if diff > 0:
+            up[i] = diff
+        elif diff < 0:
+            down[i] = -diff
+
+    alpha = 1.0 / window
+    emaup = ewm_mean(up, alpha, window)
+    emadn = ewm_mean(down, alpha, window)
+
+    out = np.empty(n)
+    for i in range(n):
+        if emadn[i] == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + emaup[i] / emadn[i])
+    return out
+
+
+@njit(cache=True, nogil=True)
+def macd(close, window_fast, window_slow, window_sign):
+    """ta.trend.MACD: (macd, macd_signal, macd_diff)"""
+    line = ema(close, window_fast) - ema(close, window_slow)
+    signal = ema(line, window_sign)
+    return line, signal, line - signal
+
+
+@njit(cache=True, nogil=True)
+def volume_ratio(volume, window):
+    """Last volume over the mean of the last `window` volumes (1.0 if undefined)"""
+    n = volume.shape[0]
+    if n < window:
+        return 1.0
+    total = 0.0
+    for i in range(n - window, n):
+        total += volume[i]
+    avg = total / window
+    return volume[n - 1] / avg if avg > 0 else 1.0
+
+
+@njit(cache=True, nogil=True)
+def pct_change(values):
+    """pandas Series.pct_change() for gap-free data"""
+    n = values.size
+    out = np.empty(n)
+    if n == 0:
+        return out
+    out[0] = np.nan
+    for i in range(1, n):
+        out[i] = values[i] / values[i - 1] - 1.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_std(values, window):
+    """pandas rolling(window).std() (ddof=1) in one pass with running sums"""
+    n = values.size
+    out = np.full(n, np.nan)
+    if window < 2:
+        return out
+
+    total = 0.0
+    total_sq = 0.0
+    nans = 0
+    for i in range(n):
+        cur = values[i]
+        if cur == cur:
+            total += cur
+            total_sq += cur * cur
+        else:
+            nans += 1
+
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                total -= old
+                total_sq -= old * old
+            else:
+                nans -= 1
+
+        if i >= window - 1 and nans == 0:
+            var = (total_sq - total * total / window) / (window - 1)
+            out[i] = np.sqrt(var) if var > 0 else 0.0
+    return out
+
+
+def compute_core_indicators(close, rsi_window=14, ema_short=9, ema_long=21,
+                            macd_fast=12, macd_slow=26, macd_sign=9):
+    """RSI, EMA pair and MACD trio from a close array in one call"""
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    macd_line, macd_signal, macd_hist = macd(close, macd_fast, macd_slow, macd_sign)
+    return (
+        rsi(close, rsi_window),
+        ema(close, ema_short),
+        ema(close, ema_long),
+        macd_line,
+        macd_signal,
+        macd_hist,
+    )
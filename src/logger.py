@@ -1,4 +1,7 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import requests
 import json
 import sys
@@ -26,8 +29,13 @@ class TradingLogger:
             fh.setFormatter(formatter)
             ch.setFormatter(formatter)
             
-            self.logger.addHandler(fh)
-            self.logger.addHandler(ch)
+            # Запись в файл/консоль идет в фоновом потоке, торговый цикл только кладет запись в очередь
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            
+            self.logger.addHandler(QueueHandler(log_queue))
         
         self.telegram_enabled = bool(Config.TELEGRAM_BOT_TOKEN and Config.TELEGRAM_CHAT_ID)
     
@@ -46,16 +54,24 @@ class TradingLogger:
             self.logger.warning(f"Failed to send Telegram message: {e}")
             return False
     
-    def log(self, message, level='info', send_telegram=False):
+    _LEVELS = {'info': logging.INFO, 'warning': logging.WARNING, 'error': logging.ERROR, 'debug': logging.DEBUG}
+    
+    def is_enabled(self, level='info'):
+        """Включен ли уровень - чтобы не строить дорогие сообщения зря"""
+        levelno = self._LEVELS.get(level)
+        return levelno is not None and self.logger.isEnabledFor(levelno)
+    
+    def log(self, message, level='info', *args, send_telegram=False):
+        """Логирование; аргументы форматируются через %, только если уровень включен"""
+        enabled = self.is_enabled(level)
+        if not enabled and not (send_telegram and self.telegram_enabled):
+            return
+        
         # Заменяем Unicode символы на текстовые для Windows
         message = message.replace('✓', '[OK]').replace('✗', '[ERROR]')
         
-        if level == 'info':
-            self.logger.info(message)
-        elif level == 'warning':
-            self.logger.warning(message)
-        elif level == 'error':
-            self.logger.error(message)
+        if enabled:
+            self.logger.log(self._LEVELS[level], message, *args)
         
         if send_telegram and self.telegram_enabled:
-            self._send_telegram_sync(message)
\ No newline at end of file
+            self._send_telegram_sync(message % args if args else message)
@@ -1,11 +1,21 @@
+import atexit
 import json
-import pandas as pd
+from collections import Counter, defaultdict
 from datetime import datetime
 from config.config import Config
 
 class PerformanceTracker:
     def __init__(self):
         self.trades = []
+        # Сколько сделок уже дописано в файл; сам файл открывается один раз при первой записи
+        self._saved_count = 0
+        self._log_file = None
+        
+        # Накопительные агрегаты - метрики обновляются за O(1) на сделку
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0
+        self._peak_balance = None
+        self._symbol_stats = defaultdict(Counter)
         self.performance_data = {
             'total_trades': 0,
             'winning_trades': 0,
@@ -19,54 +29,76 @@ class PerformanceTracker:
         
     def record_trade(self, trade_data):
         """Запись данных о сделке"""
-        self.trades.append({
+        trade = {
             **trade_data,
             'timestamp': datetime.now().isoformat()
-        })
-        self._update_performance()
+        }
+        self.trades.append(trade)
+        self._update_performance(trade)
         
         if Config.SAVE_TRADES:
             self._save_trades()
     
-    def _update_performance(self):
-        """Обновление метрик производительности"""
-        if not self.trades:
-            return
-        
-        df = pd.DataFrame(self.trades)
+    def _update_performance(self, trade):
+        """Обновление метрик производительности по одной новой сделке"""
+        pnl = trade['pnl']
+        perf = self.performance_data
         
         # Базовые метрики
-        self.performance_data['total_trades'] = len(df)
-        self.performance_data['winning_trades'] = len(df[df['pnl'] > 0])
-        self.performance_data['losing_trades'] = len(df[df['pnl'] < 0])
-        self.performance_data['total_pnl'] = df['pnl'].sum()
+        perf['total_trades'] += 1
+        perf['total_pnl'] += pnl
+        if pnl > 0:
+            perf['winning_trades'] += 1
+            self._gross_profit += pnl
+        elif pnl < 0:
+            perf['losing_trades'] += 1
+            self._gross_loss -= pnl
         
         # Win Rate
-        if self.performance_data['total_trades'] > 0:
-            self.performance_data['win_rate'] = (
-                self.performance_data['winning_trades'] / self.performance_data['total_trades']
-            )
+        perf['win_rate'] = perf['winning_trades'] / perf['total_trades']
         
         # Profit Factor
-        gross_profit = df[df['pnl'] > 0]['pnl'].sum()
-        gross_loss = abs(df[df['pnl'] < 0]['pnl'].sum())
-        if gross_loss > 0:
-            self.performance_data['profit_factor'] = gross_profit / gross_loss
+        if self._gross_loss > 0:
+            perf['profit_factor'] = self._gross_profit / self._gross_loss
         
         # Максимальная просадка
-        if 'balance_after' in df.columns:
-            df['peak'] = df['balance_after'].cummax()
-            df['drawdown'] = (df['peak'] - df['balance_after']) / df['peak']
-            self.performance_data['max_drawdown'] = df['drawdown'].max()
+        balance = trade.get('balance_after')
+        if balance is not None:
+            if self._peak_balance is None or balance > self._peak_balance:
+                self._peak_balance = balance
+            drawdown = (self._peak_balance - balance) / self._peak_balance
+            perf['max_drawdown'] = max(perf['max_drawdown'], drawdown)
+        
+        # По символам
+        symbol = trade.get('symbol')
+        if symbol is not None:
+            stats = self._symbol_stats[symbol]
+            stats['trades'] += 1
+            stats['wins'] += pnl > 0
+            stats['total_pnl'] += pnl
     
     def _save_trades(self):
-        """Сохранение сделок в файл"""
+        """Дописывание новых сделок в файл, по одной JSON-строке на сделку"""
         try:
-            with open(Config.TRADE_LOG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.trades, f, indent=2, ensure_ascii=False)
+            if self._log_file is None:
+                # Файл сессии (NDJSON) перезаписывается при первом открытии, как раньше массив в 'w';
+                # построчная буферизация: каждая сделка сразу попадает в файл
+                self._log_file = open(Config.TRADE_LOG_FILE, 'w', buffering=1, encoding='utf-8')
+                atexit.register(self.close)
+            self._log_file.writelines(
+                json.dumps(trade, ensure_ascii=False) + '\n'
+                for trade in self.trades[self._saved_count:]
+            )
+            self._saved_count = len(self.trades)
         except Exception as e:
             print(f"Error saving trades: {e}")
     
+    def close(self):
+        """Закрытие файла сделок (повторный вызов безопасен)"""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+    
     def generate_report(self):
         """Генерация отчета"""
         report = {
@@ -107,21 +139,13 @@ class PerformanceTracker:
     
     def get_strategy_performance(self):
         """Анализ производительности по типам стратегий"""
-        if not self.trades:
-            return {}
-        
-        df = pd.DataFrame(self.trades)
-        
         # Группировка по символам (если есть информация о стратегии)
-        strategy_stats = {}
-        if 'symbol' in df.columns:
-            for symbol in df['symbol'].unique():
-                symbol_trades = df[df['symbol'] == symbol]
-                strategy_stats[symbol] = {
-                    'trades': len(symbol_trades),
-                    'win_rate': len(symbol_trades[symbol_trades['pnl'] > 0]) / len(symbol_trades),
-                    'total_pnl': symbol_trades['pnl'].sum(),
-                    'avg_pnl': symbol_trades['pnl'].mean()
-                }
-        
-        return strategy_stats
\ No newline at end of file
+        return {
+            symbol: {
+                'trades': stats['trades'],
+                'win_rate': stats['wins'] / stats['trades'],
+                'total_pnl': stats['total_pnl'],
+                'avg_pnl': stats['total_pnl'] / stats['trades']
+            }
+            for symbol, stats in self._symbol_stats.items()
+        }
@@ -1,18 +1,35 @@
+import sys
 import time
-from config.config import Config
+
+import numpy as np
+
+from config.config import CFG
 from src.logger import TradingLogger
+from src.positions import Positions
+
+# Знак стороны для сравнений SL/TP (long: +1, short: -1); боты открывают позиции
+# с сигналом стратегии ('BUY'/'SELL'), биржа отдает 'Buy'/'Sell'
+_SIDE_SIGN = {'Buy': 1.0, 'Sell': -1.0, 'BUY': 1.0, 'SELL': -1.0}
+
 
 class PositionManager:
     def __init__(self, bybit_client):
         self.client = bybit_client
         self.logger = TradingLogger()
         self.active_positions = {}
+        # Последний снимок позиций с биржи (столбцы numpy)
+        self.snapshot = Positions.from_api([])
     
-    def sync_positions(self):
-        """Упрощенная синхронизация позиций"""
+    def sync_positions(self, snapshot=None):
+        """Упрощенная синхронизация позиций по снимку биржи (можно передать уже полученный Positions)"""
         try:
-            real_positions = self.client.get_open_positions()
-            real_symbols = {pos['symbol'] for pos in real_positions}
+            if snapshot is None:
+                snapshot = self.client.get_positions_snapshot()
+            if snapshot is None:
+                # Биржа не ответила - не считаем позиции закрытыми
+                return
+            self.snapshot = snapshot
+            real_symbols = set(snapshot.symbols)
             
             # Удаляем позиции, которых нет на бирже
             for symbol in list(self.active_positions.keys()):
@@ -23,22 +40,27 @@ class PositionManager:
         except Exception as e:
             self.logger.log(f"Ошибка синхронизации позиций: {e}", 'error')
     
-    def can_open_position(self, symbol):
+    def unrealised_pnl(self):
+        """Нереализованный PnL по последнему снимку позиций"""
+        return self.snapshot.total_unrealised_pnl()
+    
+    def can_open_position(self, symbol, sync=True):
         """Проверка возможности открытия позиции"""
-        self.sync_positions()
+        if sync:
+            self.sync_positions()
         
-        if len(self.active_positions) >= Config.MAX_POSITIONS:
-            return False, f"Достигнут лимит позиций ({Config.MAX_POSITIONS})"
+        if len(self.active_positions) >= CFG.max_positions:
+            return False, f"Достигнут лимит позиций ({CFG.max_positions})"
         
         if symbol in self.active_positions:
             return False, "Позиция уже открыта"
             
         return True, "OK"
     
-    def open_position(self, symbol, side, quantity, entry_price, stop_loss, take_profit):
-        """Открытие позиции"""
+    def open_position(self, symbol, side, quantity, entry_price, stop_loss, take_profit, sync=True):
+        """Открытие позиции; sync=False, если позиции уже синхронизированы в этом цикле"""
         try:
-            can_open, reason = self.can_open_position(symbol)
+            can_open, reason = self.can_open_position(symbol, sync)
             if not can_open:
                 return False
             
@@ -46,11 +68,11 @@ class PositionManager:
             order_type = "Limit"
             price = None
             
-            if Config.USE_LIMIT_ORDERS:
+            if CFG.use_limit_orders:
                 if side == "BUY":
-                    price = entry_price * (1 - Config.LIMIT_ORDER_PRICE_OFFSET)
+                    price = entry_price * (1 - CFG.limit_order_price_offset)
                 else:
-                    price = entry_price * (1 + Config.LIMIT_ORDER_PRICE_OFFSET)
+                    price = entry_price * (1 + CFG.limit_order_price_offset)
             
             order = self.client.place_order(symbol, side, quantity, order_type, price)
             
@@ -66,8 +88,8 @@ class PositionManager:
                     'timestamp': time.time()
                 }
                 
-                self.active_positions[symbol] = position
-                self.logger.log(f"✅ ПОЗИЦИЯ ОТКРЫТА: {side} {quantity:.4f} {symbol}", 'info', True)
+                self.active_positions[sys.intern(symbol)] = position
+                self.logger.log(f"✅ ПОЗИЦИЯ ОТКРЫТА: {side} {quantity:.4f} {symbol}", 'info', send_telegram=True)
                 return True
             
             return False
@@ -76,7 +98,31 @@ class PositionManager:
             self.logger.log(f"Ошибка открытия позиции: {e}", 'error')
             return False
     
-    def get_active_positions_count(self):
+    def get_active_positions_count(self, sync=True):
         """Получение количества активных позиций"""
-        self.sync_positions()
-        return len(self.active_positions)
\ No newline at end of file
+        if sync:
+            self.sync_positions()
+        return len(self.active_positions)
+    
+    def check_exits(self, prices):
+        """Позиции, у которых цена дошла до SL/TP: {symbol: 'Stop Loss' | 'Take Profit'}"""
+        symbols = [symbol for symbol in self.active_positions if prices.get(symbol)]
+        if not symbols:
+            return {}
+        
+        # Позиции в виде столбцов: одно векторное сравнение вместо ветвлений на каждую
+        n = len(symbols)
+        positions = [self.active_positions[symbol] for symbol in symbols]
+        sides = np.fromiter((_SIDE_SIGN.get(p['side'], 0.0) for p in positions), dtype=np.float64, count=n)
+        stops = np.fromiter((p['stop_loss'] for p in positions), dtype=np.float64, count=n)
+        takes = np.fromiter((p['take_profit'] for p in positions), dtype=np.float64, count=n)
+        price = np.fromiter((prices[symbol] for symbol in symbols), dtype=np.float64, count=n)
+        
+        known = sides != 0
+        hit_sl = known & (sides * (price - stops) <= 0)
+        hit_tp = known & ~hit_sl & (sides * (price - takes) >= 0)
+        
+        return {
+            symbols[i]: 'Stop Loss' if hit_sl[i] else 'Take Profit'
+            for i in np.flatnonzero(hit_sl | hit_tp)
+        }
@@ -0,0 +1,50 @@
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def _to_float(value, default=0.0):
+    """Bybit returns numbers as strings, sometimes empty"""
+    return float(value) if value else default
+
+
+@dataclass
+class Positions:
+    """Open positions stored column-wise for vectorized portfolio math"""
+    symbols: list
+    sides: list
+    size: np.ndarray
+    avg_price: np.ndarray
+    unrealised_pnl: np.ndarray
+    leverage: np.ndarray
+
+    @classmethod
+    def from_api(cls, raw_positions):
+        """Build from the raw /v5/position/list 'list' payload, dropping empty slots"""
+        n = len(raw_positions)
+        size = np.fromiter((_to_float(p.get('size')) for p in raw_positions), dtype=np.float64, count=n)
+        avg_price = np.fromiter((_to_float(p.get('avgPrice')) for p in raw_positions), dtype=np.float64, count=n)
+        unrealised_pnl = np.fromiter((_to_float(p.get('unrealisedPnl')) for p in raw_positions), dtype=np.float64, count=n)
+        leverage = np.fromiter((_to_float(p.get('leverage'), 1.0) for p in raw_positions), dtype=np.float64, count=n)
+
+        mask = size > 0
+        open_idx = np.flatnonzero(mask)
+        return cls(
+            symbols=[sys.intern(raw_positions[i]['symbol']) for i in open_idx],
+            sides=[raw_positions[i]['side'] for i in open_idx],
+            size=size[mask],
+            avg_price=avg_price[mask],
+            unrealised_pnl=unrealised_pnl[mask],
+            leverage=leverage[mask],
+        )
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @property
+    def notional(self):
+        return self.size * self.avg_price
+
+    def total_unrealised_pnl(self):
+        return float(self.unrealised_pnl.sum())
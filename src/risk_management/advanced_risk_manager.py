@@ -30,6 +30,10 @@ class AdvancedRiskManager:
         self.daily_pnl = 0.0
         self.last_reset_date = datetime.now().date()
         
+        # Per-symbol size limits; 'symbols' may also be a plain list of names
+        symbols = config.get('symbols')
+        self._symbol_limits = symbols if isinstance(symbols, dict) else {}
+        
         self.logger = logging.getLogger(__name__)
     
     def calculate_position_size(self, entry_price: float, stop_loss: float, symbol: str) -> float:
@@ -61,7 +65,7 @@ class AdvancedRiskManager:
         position_size = position_value / entry_price
         
         # Apply symbol-specific limits
-        symbol_config = self.config.get('symbols', {}).get(symbol, {})
+        symbol_config = self._symbol_limits.get(symbol, {})
         max_position_size = symbol_config.get('max_position_size', float('inf'))
         min_position_size = symbol_config.get('min_position_size', 0)
         
@@ -1,4 +1,4 @@
-from config.config import Config
+from config.config import CFG
 from src.logger import TradingLogger
 from datetime import datetime
 
@@ -14,7 +14,7 @@ class RiskManager:
         
         # Daily limits
         self.daily_start_balance = initial_balance
-        self.daily_loss_limit = getattr(Config, 'DAILY_LOSS_LIMIT', 0.03)  # Запасной вариант
+        self.daily_loss_limit = CFG.daily_loss_limit
         self.last_reset_date = datetime.now().date()
     
     def _reset_daily_limits(self):
@@ -46,19 +46,19 @@ class RiskManager:
         """Проверка возможности торговли по рискам"""
         # Максимальная просадка
         drawdown = self.calculate_drawdown()
-        if drawdown > Config.MAX_DRAWDOWN:
-            self.logger.log(f"Торговля остановлена: превышена максимальная просадка ({drawdown:.2%})", 'warning', True)
+        if drawdown > CFG.max_drawdown:
+            self.logger.log(f"Торговля остановлена: превышена максимальная просадка ({drawdown:.2%})", 'warning', send_telegram=True)
             return False
         
         # Дневной лимит убытков
         daily_pnl = self.calculate_daily_pnl()
         if daily_pnl < -self.daily_loss_limit:
-            self.logger.log(f"Торговля остановлена: превышен дневной лимит убытков ({daily_pnl:.2%})", 'warning', True)
+            self.logger.log(f"Торговля остановлена: превышен дневной лимит убытков ({daily_pnl:.2%})", 'warning', send_telegram=True)
             return False
         
         # Минимальный баланс
         if self.current_balance < self.initial_balance * 0.3:
-            self.logger.log("Торговля остановлена: баланс ниже 30% от начального", 'warning', True)
+            self.logger.log("Торговля остановлена: баланс ниже 30% от начального", 'warning', send_telegram=True)
             return False
         
         return True
@@ -66,11 +66,11 @@ class RiskManager:
     def calculate_stop_loss_take_profit(self, entry_price, signal_type):
         """Расчет уровней стоп-лосса и тейк-профита"""
         if signal_type == 'BUY':
-            stop_loss = entry_price * (1 - Config.STOP_LOSS_PCT)
-            take_profit = entry_price * (1 + Config.TAKE_PROFIT_PCT)
+            stop_loss = entry_price * (1 - CFG.stop_loss_pct)
+            take_profit = entry_price * (1 + CFG.take_profit_pct)
         else:  # SELL
-            stop_loss = entry_price * (1 + Config.STOP_LOSS_PCT)
-            take_profit = entry_price * (1 - Config.TAKE_PROFIT_PCT)
+            stop_loss = entry_price * (1 + CFG.stop_loss_pct)
+            take_profit = entry_price * (1 - CFG.take_profit_pct)
         
         return stop_loss, take_profit
     
@@ -129,16 +129,23 @@ class RiskManager:
         if not self.trades:
             return {}
         
-        winning_trades = [t for t in self.trades if t['pnl'] > 0]
-        losing_trades = [t for t in self.trades if t['pnl'] < 0]
+        # Один проход по сделкам вместо трёх
+        winning_trades = losing_trades = 0
+        total_pnl = 0
+        for t in self.trades:
+            pnl = t['pnl']
+            total_pnl += pnl
+            if pnl > 0:
+                winning_trades += 1
+            elif pnl < 0:
+                losing_trades += 1
         
-        total_pnl = sum(t['pnl'] for t in self.trades)
-        win_rate = len(winning_trades) / len(self.trades) if self.trades else 0
+        win_rate = winning_trades / len(self.trades)
         
         return {
             'total_trades': len(self.trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
+            'winning_trades': winning_trades,
+            'losing_trades': losing_trades,
             'win_rate': win_rate,
             'total_pnl': total_pnl,
             'current_balance': self.current_balance,
@@ -0,0 +1,31 @@
+import time
+
+
+class Scheduler:
+    """Периодические задачи по монотонным часам: сон ровно до ближайшего запуска вместо опроса"""
+
+    def __init__(self):
+        # [время следующего запуска, интервал, задача]
+        self._jobs = []
+
+    def every(self, seconds, job):
+        """Запускать job каждые seconds секунд; первый запуск через один интервал"""
+        self._jobs.append([time.monotonic() + seconds, seconds, job])
+
+    def run_pending(self):
+        """Выполнение наступивших задач"""
+        for entry in self._jobs:
+            now = time.monotonic()
+            if entry[0] > now:
+                continue
+            # Следующий запуск по сетке интервала; отставшую сетку сдвигаем от текущего момента
+            entry[0] += entry[1]
+            if entry[0] <= now:
+                entry[0] = now + entry[1]
+            entry[2]()
+
+    def idle_seconds(self):
+        """Сколько можно спать до ближайшей задачи"""
+        if not self._jobs:
+            return 0.0
+        return max(0.0, min(entry[0] for entry in self._jobs) - time.monotonic())
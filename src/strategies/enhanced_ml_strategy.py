@@ -8,6 +8,8 @@ from sklearn.preprocessing import StandardScaler
 import joblib
 import logging
 
+_log = logging.getLogger(__name__)
+
 @dataclass
 class EnhancedSignal:
     symbol: str
@@ -25,6 +27,16 @@ class EnhancedMLStrategy:
         self.strategy_config = config.get('enhanced_strategy', {})
         self.indicators_config = self.strategy_config.get('technical_indicators', {})
         
+        # Indicator windows resolved once instead of per calculate_indicators call
+        self.rsi_period = self.indicators_config.get('rsi_period', 14)
+        self.macd_slow = self.indicators_config.get('macd_slow', 26)
+        self.macd_fast = self.indicators_config.get('macd_fast', 12)
+        self.macd_signal = self.indicators_config.get('macd_signal', 9)
+        self.bb_period = self.indicators_config.get('bb_period', 20)
+        self.atr_period = self.indicators_config.get('atr_period', 14)
+        self.ema_short_period = self.indicators_config.get('ema_short', 20)
+        self.ema_long_period = self.indicators_config.get('ema_long', 50)
+        
         # ML model
         self.ml_model = None
         self.scaler = StandardScaler()
@@ -35,7 +47,7 @@ class EnhancedMLStrategy:
         self.min_confidence = self.strategy_config.get('min_confidence', 0.6)
         self.required_confidence_diff = 0.1
         
-        self.logger = logging.getLogger(__name__)
+        self.logger = _log
         
         # Try to load pre-trained model
         self._load_model()
@@ -48,37 +60,37 @@ class EnhancedMLStrategy:
         # Price-based indicators
         df['rsi'] = ta.momentum.RSIIndicator(
             df['close'], 
-            window=self.indicators_config.get('rsi_period', 14)
+            window=self.rsi_period
         ).rsi()
         
         df['macd'] = ta.trend.MACD(
             df['close'],
-            window_slow=self.indicators_config.get('macd_slow', 26),
-            window_fast=self.indicators_config.get('macd_fast', 12),
-            window_sign=self.indicators_config.get('macd_signal', 9)
+            window_slow=self.macd_slow,
+            window_fast=self.macd_fast,
+            window_sign=self.macd_signal
         ).macd()
         
         # Volatility indicators
         df['bb_upper'] = ta.volatility.BollingerBands(
             df['close'], 
-            window=self.indicators_config.get('bb_period', 20)
+            window=self.bb_period
         ).bollinger_hband()
         df['bb_lower'] = ta.volatility.BollingerBands(df['close']).bollinger_lband()
         df['bb_middle'] = ta.volatility.BollingerBands(df['close']).bollinger_mavg()
         
         df['atr'] = ta.volatility.AverageTrueRange(
             df['high'], df['low'], df['close'],
-            window=self.indicators_config.get('atr_period', 14)
+            window=self.atr_period
         ).average_true_range()
         
         # Trend indicators
         df['ema_short'] = ta.trend.EMAIndicator(
             df['close'], 
-            window=self.indicators_config.get('ema_short', 20)
+            window=self.ema_short_period
         ).ema_indicator()
         df['ema_long'] = ta.trend.EMAIndicator(
             df['close'], 
-            window=self.indicators_config.get('ema_long', 50)
+            window=self.ema_long_period
         ).ema_indicator()
         
         # Momentum indicators
@@ -116,33 +128,30 @@ class EnhancedMLStrategy:
         current_features = []
         for col in feature_columns:
             if col in df.columns:
+                values = df[col].to_numpy(dtype=np.float64)
                 # Current value
-                current_features.append(df[col].iloc[-1])
+                current_features.append(values[-1])
                 # Lag 1
-                if len(df) > 1:
-                    current_features.append(df[col].iloc[-2])
-                else:
-                    current_features.append(0)
+                current_features.append(values[-2] if len(values) > 1 else 0)
                 # Rolling mean
-                if len(df) > 5:
-                    current_features.append(df[col].tail(5).mean())
-                else:
-                    current_features.append(df[col].mean())
+                current_features.append(np.nanmean(values[-5:] if len(values) > 5 else values))
         
         return np.array(current_features).reshape(1, -1)
     
     def generate_signal(self, symbol: str, data: Dict) -> EnhancedSignal:
         """Generate trading signal using combined approach"""
-        df = pd.DataFrame(data['candles'])
-        if df.empty:
-            return EnhancedSignal(symbol, "HOLD", 0.0, data['current_price'], 0, 0, data['timestamp'], "No data")
-        
-        df_with_indicators = self.calculate_indicators(df)
+        candles = data.get('candles')
         current_price = data['current_price']
         
-        if len(df_with_indicators) < 20:
+        # Length checks first: skipped ticks never build a frame or run indicators
+        if candles is None or len(candles) == 0:
+            return EnhancedSignal(symbol, "HOLD", 0.0, current_price, 0, 0, data['timestamp'], "No data")
+        if len(candles) < 20:
             return EnhancedSignal(symbol, "HOLD", 0.0, current_price, 0, 0, data['timestamp'], "Insufficient data")
         
+        # New frame so the indicator columns are not added to the caller's candles
+        df_with_indicators = self.calculate_indicators(pd.DataFrame(candles))
+        
         # Get signals from different methods
         technical_signal = self._technical_analysis(df_with_indicators, current_price, symbol)
         ml_signal = self._ml_analysis(df_with_indicators, current_price, symbol)
@@ -154,42 +163,49 @@ class EnhancedMLStrategy:
     
     def _technical_analysis(self, df: pd.DataFrame, current_price: float, symbol: str) -> EnhancedSignal:
         """Technical analysis based signal generation"""
-        last = df.iloc[-1]
-        prev = df.iloc[-2] if len(df) > 1 else last
+        # Columns as numpy arrays once; j is the previous row (or the last one again)
+        rsi = df['rsi'].to_numpy()
+        macd = df['macd'].to_numpy()
+        close = df['close'].to_numpy()
+        bb_lower = df['bb_lower'].to_numpy()
+        bb_upper = df['bb_upper'].to_numpy()
+        ema_short = df['ema_short'].to_numpy()
+        ema_long = df['ema_long'].to_numpy()
+        j = -2 if len(df) > 1 else -1
         
         buy_signals = 0
         sell_signals = 0
         reasons = []
         
         # RSI signals
-        if last['rsi'] < 30 and prev['rsi'] >= 30:
+        if rsi[-1] < 30 and rsi[j] >= 30:
             buy_signals += 1
             reasons.append("RSI oversold")
-        elif last['rsi'] > 70 and prev['rsi'] <= 70:
+        elif rsi[-1] > 70 and rsi[j] <= 70:
             sell_signals += 1
             reasons.append("RSI overbought")
         
         # MACD signals
-        if last['macd'] > 0 and prev['macd'] <= 0:
+        if macd[-1] > 0 and macd[j] <= 0:
             buy_signals += 1
             reasons.append("MACD bullish crossover")
-        elif last['macd'] < 0 and prev['macd'] >= 0:
+        elif macd[-1] < 0 and macd[j] >= 0:
             sell_signals += 1
             reasons.append("MACD bearish crossover")
         
         # Bollinger Bands signals
-        if last['close'] <= last['bb_lower']:
+        if close[-1] <= bb_lower[-1]:
             buy_signals += 1
             reasons.append("BB oversold")
-        elif last['close'] >= last['bb_upper']:
+        elif close[-1] >= bb_upper[-1]:
             sell_signals += 1
             reasons.append("BB overbought")
         
         # EMA crossover
-        if last['ema_short'] > last['ema_long'] and prev['ema_short'] <= prev['ema_long']:
+        if ema_short[-1] > ema_long[-1] and ema_short[j] <= ema_long[j]:
             buy_signals += 1
             reasons.append("EMA bullish crossover")
-        elif last['ema_short'] < last['ema_long'] and prev['ema_short'] >= prev['ema_long']:
+        elif ema_short[-1] < ema_long[-1] and ema_short[j] >= ema_long[j]:
             sell_signals += 1
             reasons.append("EMA bearish crossover")
         
@@ -1,23 +1,60 @@
+import functools
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+
 from src.bybit_client import BybitClient
 from src.logger import TradingLogger
 
+
+class SymbolSpec(NamedTuple):
+    """Торговые ограничения инструмента"""
+    min_order_qty: float
+    max_order_qty: float
+    qty_step: float
+    min_order_value: float
+
+
+_DEFAULT_SPEC = SymbolSpec(min_order_qty=0.001, max_order_qty=1000000, qty_step=0.001, min_order_value=5.0)
+
+# Значения по умолчанию для популярных символов
+_RAW_DEFAULT_SPECS = {
+    'BTCUSDT': _DEFAULT_SPEC._replace(min_order_qty=0.001, qty_step=0.001),
+    'ETHUSDT': _DEFAULT_SPEC._replace(min_order_qty=0.01, qty_step=0.01),
+    'SOLUSDT': _DEFAULT_SPEC._replace(min_order_qty=0.1, qty_step=0.1),
+    'XRPUSDT': _DEFAULT_SPEC._replace(min_order_qty=0.1, qty_step=0.1),
+    'ADAUSDT': _DEFAULT_SPEC._replace(min_order_qty=1.0, qty_step=0.1),
+    'DOTUSDT': _DEFAULT_SPEC._replace(min_order_qty=0.1, qty_step=0.1),
+    'LINKUSDT': _DEFAULT_SPEC._replace(min_order_qty=0.1, qty_step=0.1),
+}
+
+# Только для чтения, ключи интернированы
+_DEFAULT_SPECS = MappingProxyType({sys.intern(k): v for k, v in _RAW_DEFAULT_SPECS.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def _step_decimals(step):
+    """Количество знаков после запятой у шага (набор шагов мал и постоянен)"""
+    step_str = str(step)
+    if '.' in step_str:
+        return len(step_str.split('.')[1])
+    return 0
+
+
 class SymbolInfo:
     def __init__(self):
         self.client = BybitClient()
         self.logger = TradingLogger()
         self.symbol_info_cache = {}
+        self._instruments_loaded = False
     
     def _round_to_step(self, quantity, step):
         """Округление количества до шага с учетом проблем с float"""
         if step <= 0:
             return quantity
         
-        # Определяем количество знаков после запятой для шага
-        step_str = str(step)
-        if '.' in step_str:
-            decimal_places = len(step_str.split('.')[1])
-        else:
-            decimal_places = 0
+        # Количество знаков после запятой для шага
+        decimal_places = _step_decimals(step)
         
         # Округляем до шага
         rounded_quantity = round(quantity / step) * step
@@ -31,69 +68,64 @@ class SymbolInfo:
         if symbol in self.symbol_info_cache:
             return self.symbol_info_cache[symbol]
         
+        # Один запрос на все инструменты вместо запроса на каждый символ
+        if not self._instruments_loaded:
+            self._load_all_instruments()
+            if symbol in self.symbol_info_cache:
+                info = self.symbol_info_cache[symbol]
+                self.logger.log(f"Symbol info for {symbol}: min_qty={info.min_order_qty}, qty_step={info.qty_step}, min_value={info.min_order_value}", 'info')
+                return info
+        
+        # Возвращаем значения по умолчанию, если не удалось получить информацию;
+        # кэшируем их только когда список загружен, иначе следующий вызов повторит запрос
+        default_info = self._get_default_symbol_info(symbol)
+        if self._instruments_loaded:
+            self.symbol_info_cache[symbol] = default_info
+        return default_info
+    
+    def _load_all_instruments(self):
+        """Загрузка параметров всех linear-инструментов одним проходом по страницам"""
+        params = {'category': 'linear', 'limit': 1000}
+        pages = 0
         try:
-            response = self.client._make_request('GET', '/v5/market/instruments-info', {
-                'category': 'linear',
-                'symbol': symbol
-            })
-            
-            if response and 'result' in response and 'list' in response['result']:
-                instruments = response['result']['list']
-                if instruments and len(instruments) > 0:
-                    instrument = instruments[0]
+            while True:
+                response = self.client._make_request('GET', '/v5/market/instruments-info', params)
+                if not response or 'result' not in response or 'list' not in response['result']:
+                    break
+                
+                for instrument in response['result']['list']:
                     lot_filter = instrument.get('lotSizeFilter', {})
-                    info = {
-                        'min_order_qty': float(lot_filter.get('minOrderQty', 0)),
-                        'max_order_qty': float(lot_filter.get('maxOrderQty', 0)),
-                        'qty_step': float(lot_filter.get('qtyStep', 0.001)),
-                        'min_order_value': float(lot_filter.get('minOrderAmt', 5.0)),
-                    }
-                    self.symbol_info_cache[symbol] = info
-                    self.logger.log(f"Symbol info for {symbol}: min_qty={info['min_order_qty']}, qty_step={info['qty_step']}, min_value={info['min_order_value']}", 'info')
-                    return info
-            
-            # Возвращаем значения по умолчанию, если не удалось получить информацию
-            default_info = self._get_default_symbol_info(symbol)
-            self.symbol_info_cache[symbol] = default_info
-            return default_info
+                    self.symbol_info_cache[sys.intern(instrument['symbol'])] = SymbolSpec(
+                        min_order_qty=float(lot_filter.get('minOrderQty', 0)),
+                        max_order_qty=float(lot_filter.get('maxOrderQty', 0)),
+                        qty_step=float(lot_filter.get('qtyStep', 0.001)),
+                        min_order_value=float(lot_filter.get('minOrderAmt', 5.0)),
+                    )
+                pages += 1
+                
+                cursor = response['result'].get('nextPageCursor')
+                if not cursor:
+                    break
+                params = {'category': 'linear', 'limit': 1000, 'cursor': cursor}
             
+            # Без единой разобранной страницы флаг не ставим - повторим при следующем вызове
+            if pages:
+                self._instruments_loaded = True
+            else:
+                self.logger.log("Instruments info unavailable, using default specs for now", 'warning')
         except Exception as e:
-            self.logger.log(f"Error getting symbol info for {symbol}: {e}", 'error')
-            default_info = self._get_default_symbol_info(symbol)
-            self.symbol_info_cache[symbol] = default_info
-            return default_info
+            self.logger.log(f"Error loading instruments info: {e}", 'error')
     
     def _get_default_symbol_info(self, symbol):
         """Значения по умолчанию для популярных символов"""
-        default_info = {
-            'min_order_qty': 0.001,
-            'max_order_qty': 1000000,
-            'qty_step': 0.001,
-            'min_order_value': 5.0,
-        }
-        
-        # Специфичные настройки для известных символов
-        symbol_specific = {
-            'BTCUSDT': {'min_order_qty': 0.001, 'qty_step': 0.001},
-            'ETHUSDT': {'min_order_qty': 0.01, 'qty_step': 0.01},
-            'SOLUSDT': {'min_order_qty': 0.1, 'qty_step': 0.1},
-            'XRPUSDT': {'min_order_qty': 0.1, 'qty_step': 0.1},
-            'ADAUSDT': {'min_order_qty': 1.0, 'qty_step': 0.1},
-            'DOTUSDT': {'min_order_qty': 0.1, 'qty_step': 0.1},
-            'LINKUSDT': {'min_order_qty': 0.1, 'qty_step': 0.1},
-        }
-        
-        if symbol in symbol_specific:
-            default_info.update(symbol_specific[symbol])
-        
-        return default_info
+        return _DEFAULT_SPECS.get(symbol, _DEFAULT_SPEC)
     
     def validate_order_quantity(self, symbol, quantity, price):
         """Проверка валидности размера ордера"""
         info = self.get_symbol_info(symbol)
         
         # Округляем количество до шага для проверки
-        step = info['qty_step']
+        step = info.qty_step
         rounded_quantity = self._round_to_step(quantity, step)
         
         # Проверяем, что округленное количество близко к исходному (допуск 0.0001)
@@ -101,20 +133,20 @@ class SymbolInfo:
             return False, f"Quantity {quantity} is not a multiple of step {step}"
         
         # Проверка минимального количества
-        if rounded_quantity < info['min_order_qty']:
-            return False, f"Quantity {rounded_quantity} is less than minimum {info['min_order_qty']}"
+        if rounded_quantity < info.min_order_qty:
+            return False, f"Quantity {rounded_quantity} is less than minimum {info.min_order_qty}"
         
         # Проверка минимальной стоимости
         order_value = rounded_quantity * price
-        if order_value < info['min_order_value']:
-            return False, f"Order value {order_value:.2f} USDT is less than minimum {info['min_order_value']} USDT"
+        if order_value < info.min_order_value:
+            return False, f"Order value {order_value:.2f} USDT is less than minimum {info.min_order_value} USDT"
         
         return True, "Valid"
     
     def calculate_proper_quantity(self, symbol, desired_usdt_amount, price):
         """Расчет правильного количества с учетом ограничений символа"""
         info = self.get_symbol_info(symbol)
-        step = info['qty_step']
+        step = info.qty_step
         
         # Базовая расчетная quantity
         base_quantity = desired_usdt_amount / price
@@ -123,26 +155,26 @@ class SymbolInfo:
         quantity = self._round_to_step(base_quantity, step)
         
         # Проверяем минимальное количество
-        if quantity < info['min_order_qty']:
-            quantity = info['min_order_qty']
+        if quantity < info.min_order_qty:
+            quantity = info.min_order_qty
             # Пересчитываем с минимальным количеством
             quantity = self._round_to_step(quantity, step)
         
         # Проверяем минимальную стоимость
         order_value = quantity * price
-        if order_value < info['min_order_value']:
+        if order_value < info.min_order_value:
             # Рассчитываем минимальное количество для минимальной стоимости
-            min_quantity = info['min_order_value'] / price
+            min_quantity = info.min_order_value / price
             quantity = self._round_to_step(min_quantity, step)
             
             # Проверяем, что не меньше минимального количества
-            if quantity < info['min_order_qty']:
-                quantity = info['min_order_qty']
+            if quantity < info.min_order_qty:
+                quantity = info.min_order_qty
                 quantity = self._round_to_step(quantity, step)
         
         # Проверяем максимальное количество (на всякий случай)
-        if quantity > info['max_order_qty']:
-            quantity = info['max_order_qty']
+        if quantity > info.max_order_qty:
+            quantity = info.max_order_qty
             quantity = self._round_to_step(quantity, step)
         
         final_value = quantity * price
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 import pandas as pd
@@ -21,9 +23,11 @@ class EnhancedTradingBot:
         self.active_positions = {}
         self.pending_orders = {}
         self.is_running = False
+        self._stop_event = asyncio.Event()
+        self._tick_time = None
         
-        # Performance tracking
-        self.performance_history = []
+        # Performance tracking (ring buffer: old snapshots fall off the front)
+        self.performance_history = deque(maxlen=1000)
         
         self.logger = logging.getLogger(__name__)
         self.setup_logging()
@@ -45,14 +49,20 @@ class EnhancedTradingBot:
         self.is_running = True
         self.logger.info("Starting Enhanced Trading Bot")
         
+        tick_interval = self.config.get('tick_interval', 60)
+        next_deadline = time.monotonic() + tick_interval
+        
         try:
-            while self.is_running:
+            while self.is_running and not self._stop_event.is_set():
                 try:
                     # Check risk limits
                     if self.risk_manager.should_stop_trading():
                         self.logger.error("Trading stopped due to risk limits")
                         break
                     
+                    # One wall-clock stamp per tick keeps every record of the cycle aligned
+                    self._tick_time = datetime.now()
+                    
                     # Process each symbol
                     for symbol in self.config.get('symbols', []):
                         await self.process_symbol(symbol)
@@ -60,18 +70,39 @@ class EnhancedTradingBot:
                     # Update performance metrics
                     self._update_performance_metrics()
                     
-                    # Sleep between iterations
-                    await asyncio.sleep(self.config.get('tick_interval', 60))
+                    # Sleep until the next tick, net of the time this cycle took
+                    await self._wait_for_stop(next_deadline - time.monotonic())
+                    next_deadline = max(next_deadline + tick_interval, time.monotonic())
                     
                 except Exception as e:
                     self.logger.error(f"Error in main loop: {e}")
-                    await asyncio.sleep(10)
+                    await self._wait_for_stop(10)
+                    next_deadline = time.monotonic() + tick_interval
                     
         except KeyboardInterrupt:
             self.logger.info("Bot stopped by user")
         finally:
+            self._tick_time = None
             await self.cleanup()
     
+    def stop(self):
+        """Ask the main loop to exit at the next wait point"""
+        self.is_running = False
+        self._stop_event.set()
+    
+    def _now(self) -> datetime:
+        """Timestamp of the current tick, or the wall clock outside the main loop"""
+        return self._tick_time or datetime.now()
+    
+    async def _wait_for_stop(self, timeout: float):
+        """Sleep up to timeout seconds, returning early if stop() is called"""
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    
     async def process_symbol(self, symbol: str):
         """Process trading for a specific symbol"""
         try:
@@ -123,7 +154,7 @@ class EnhancedTradingBot:
                 'ask': ticker['ask'],
                 'volume': ticker['baseVolume'],
                 'order_book': order_book,
-                'timestamp': datetime.now().timestamp()
+                'timestamp': self._now().timestamp()
             }
             
         except Exception as e:
@@ -162,13 +193,14 @@ class EnhancedTradingBot:
                 order = await self.exchange.create_market_sell_order(symbol, position_size)
             
             # Record position
+            now = self._now()
             self.active_positions[symbol] = {
                 'side': signal.action.lower(),
                 'entry_price': current_price,
                 'size': position_size,
                 'stop_loss': signal.stop_loss,
                 'take_profit': signal.take_profit,
-                'entry_time': datetime.now(),
+                'entry_time': now,
                 'signal_confidence': signal.confidence,
                 'signal_reason': signal.reason
             }
@@ -188,7 +220,7 @@ class EnhancedTradingBot:
                     'size': position_size,
                     'stop_loss': signal.stop_loss,
                     'take_profit': signal.take_profit,
-                    'timestamp': datetime.now(),
+                    'timestamp': now,
                     'confidence': signal.confidence,
                     'reason': signal.reason
                 })
@@ -230,7 +262,7 @@ class EnhancedTradingBot:
                 exit_reason = "Additional exit condition"
             
             if should_exit:
-                await self.exit_trade(symbol, exit_reason, pnl)
+                await self.exit_trade(symbol, exit_reason, pnl, current_price)
                 
         except Exception as e:
             self.logger.error(f"Error monitoring position for {symbol}: {e}")
@@ -238,7 +270,7 @@ class EnhancedTradingBot:
     async def check_additional_exit_conditions(self, symbol: str, position: Dict, market_data: Dict) -> bool:
         """Check additional exit conditions like time-based exits or signal reversal"""
         # Time-based exit (e.g., close position after 4 hours)
-        position_age = datetime.now() - position['entry_time']
+        position_age = self._now() - position['entry_time']
         if position_age.total_seconds() > 4 * 3600:  # 4 hours
             self.logger.info(f"Closing position for {symbol} due to time limit")
             return True
@@ -253,8 +285,8 @@ class EnhancedTradingBot:
         
         return False
     
-    async def exit_trade(self, symbol: str, reason: str, pnl: float):
-        """Exit a trade"""
+    async def exit_trade(self, symbol: str, reason: str, pnl: float, exit_price: Optional[float] = None):
+        """Exit a trade; exit_price should be the price already used to compute pnl"""
         try:
             position = self.active_positions[symbol]
             
@@ -277,8 +309,8 @@ class EnhancedTradingBot:
             # Save to database if available
             if self.db_manager:
                 await self.db_manager.update_trade_exit(symbol, {
-                    'exit_price': await self.get_current_price(symbol),
-                    'exit_time': datetime.now(),
+                    'exit_price': exit_price if exit_price is not None else await self.get_current_price(symbol),
+                    'exit_time': self._now(),
                     'pnl': pnl,
                     'exit_reason': reason
                 })
@@ -301,25 +333,22 @@ class EnhancedTradingBot:
     def _update_performance_metrics(self):
         """Update performance metrics"""
         metrics = self.risk_manager.get_performance_metrics()
-        metrics['timestamp'] = datetime.now()
+        metrics['timestamp'] = self._now()
         metrics['active_positions'] = len(self.active_positions)
         
         self.performance_history.append(metrics)
-        
-        # Keep only last 1000 records
-        if len(self.performance_history) > 1000:
-            self.performance_history = self.performance_history[-1000:]
     
     def get_performance_report(self) -> Dict:
         """Get comprehensive performance report"""
         if not self.performance_history:
             return {}
         
-        latest = self.performance_history[-1]
+        history = self.performance_history
+        latest = history[-1]
         
         return {
             'summary': latest,
-            'recent_trades': self.performance_history[-10:],  # Last 10 updates
+            'recent_trades': [history[i] for i in range(max(len(history) - 10, 0), len(history))],  # Last 10 updates
             'active_positions': list(self.active_positions.keys()),
             'risk_status': {
                 'can_trade': not self.risk_manager.should_stop_trading(),
@@ -328,24 +357,31 @@ class EnhancedTradingBot:
             }
         }
     
+    async def _close_position(self, symbol: str, reason: str):
+        """Close a single position at the current market price"""
+        current_price = await self.get_current_price(symbol)
+        position = self.active_positions[symbol]
+        
+        if position['side'] == 'buy':
+            pnl = (current_price - position['entry_price']) * position['size']
+        else:
+            pnl = (position['entry_price'] - current_price) * position['size']
+        
+        await self.exit_trade(symbol, reason, pnl, current_price)
+    
     async def cleanup(self):
         """Cleanup resources"""
-        self.is_running = False
+        self.stop()
         
-        # Close all open positions
-        for symbol in list(self.active_positions.keys()):
-            try:
-                current_price = await self.get_current_price(symbol)
-                position = self.active_positions[symbol]
-                
-                if position['side'] == 'buy':
-                    pnl = (current_price - position['entry_price']) * position['size']
-                else:
-                    pnl = (position['entry_price'] - current_price) * position['size']
-                
-                await self.exit_trade(symbol, "Bot shutdown", pnl)
-            except Exception as e:
-                self.logger.error(f"Error closing position for {symbol} during cleanup: {e}")
+        # Close all open positions concurrently
+        symbols = list(self.active_positions.keys())
+        results = await asyncio.gather(
+            *(self._close_position(symbol, "Bot shutdown") for symbol in symbols),
+            return_exceptions=True
+        )
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error closing position for {symbol} during cleanup: {result}")
         
         # Save ML model
         self.strategy.save_model()
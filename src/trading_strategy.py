@@ -1,14 +1,18 @@
+import math
 import pandas as pd
 import numpy as np
-from config.config import Config
+from config.config import Config, CFG
 from src.data_processor import DataProcessor
+from src.indicators import volume_ratio
 from src.logger import TradingLogger
+from src.warmup import warmup
 
 class TradingStrategy:
     def __init__(self):
         self.data_processor = DataProcessor()
         self.logger = TradingLogger()
         self.signal_history = {}
+        warmup()
     
     def analyze_symbol(self, symbol, df):
         """Консервативный анализ с множеством фильтров"""
@@ -18,11 +22,16 @@ class TradingStrategy:
             
             # Расчет индикаторов
             df = self.data_processor.calculate_technical_indicators(df)
-            df = self.data_processor.calculate_volatility(df)
+            
+            # Ценовые столбцы - в numpy один раз на весь анализ
+            close = df['close'].to_numpy(dtype=np.float64)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            volume = df['volume'].to_numpy(dtype=np.float64)
             
             # Фильтр объема
-            volume_ratio = self._calculate_volume_ratio(df)
-            current_volatility = df['volatility'].iloc[-1] if 'volatility' in df.columns else 0.02
+            volume_ratio = self._calculate_volume_ratio(volume)
+            current_volatility = self.data_processor.last_volatility_of(close)
             
             # Проверка условий торговли
             can_trade, reason = Config.should_trade(symbol, current_volatility, volume_ratio)
@@ -30,11 +39,11 @@ class TradingStrategy:
                 return 'HOLD', [reason], 0
             
             # Получаем сигналы
-            signals = self._get_conservative_signals(df)
+            signals = self._get_conservative_signals(df, close, high, low)
             signal_strength = self._calculate_signal_strength(signals)
             
             # Требуем сильный сигнал
-            if signal_strength >= Config.MIN_SIGNAL_STRENGTH:
+            if signal_strength >= CFG.min_signal_strength:
                 if signals['buy'] > signals['sell']:
                     return 'BUY', signals['details'], signal_strength
                 else:
@@ -46,46 +55,47 @@ class TradingStrategy:
             self.logger.log(f"Error analyzing {symbol}: {e}", 'error')
             return 'HOLD', ["Ошибка анализа"], 0
     
-    def _get_conservative_signals(self, df):
+    def _get_conservative_signals(self, df, close, high, low):
         """Консервативные сигналы с подтверждением"""
-        current = df.iloc[-1]
-        prev_1 = df.iloc[-2]
-        prev_2 = df.iloc[-3]
+        # Берем столбцы один раз как numpy-массивы вместо трех строк df.iloc
+        rsi = df['rsi'].to_numpy(dtype=np.float64, copy=False)
+        ema_short = df['ema_short'].to_numpy(dtype=np.float64, copy=False)
+        ema_long = df['ema_long'].to_numpy(dtype=np.float64, copy=False)
         
         signals = {'buy': 0, 'sell': 0, 'details': []}
         
         # RSI с подтверждением
-        if not np.isnan(current['rsi']):
-            if (current['rsi'] < Config.RSI_OVERSOLD and 
-                prev_1['rsi'] < Config.RSI_OVERSOLD):
+        if not math.isnan(rsi[-1]):
+            if (rsi[-1] < CFG.rsi_oversold and 
+                rsi[-2] < CFG.rsi_oversold):
                 signals['buy'] += 2.0
                 signals['details'].append('RSI_OVERSOLD_CONFIRMED')
-            elif (current['rsi'] > Config.RSI_OVERBOUGHT and 
-                  prev_1['rsi'] > Config.RSI_OVERBOUGHT):
+            elif (rsi[-1] > CFG.rsi_overbought and 
+                  rsi[-2] > CFG.rsi_overbought):
                 signals['sell'] += 2.0
                 signals['details'].append('RSI_OVERBOUGHT_CONFIRMED')
         
         # EMA кросс с подтверждением
-        if not np.isnan(current['ema_short']) and not np.isnan(current['ema_long']):
-            if (current['ema_short'] > current['ema_long'] and 
-                prev_1['ema_short'] > prev_1['ema_long'] and
-                prev_2['ema_short'] <= prev_2['ema_long']):
+        if not math.isnan(ema_short[-1]) and not math.isnan(ema_long[-1]):
+            if (ema_short[-1] > ema_long[-1] and 
+                ema_short[-2] > ema_long[-2] and
+                ema_short[-3] <= ema_long[-3]):
                 signals['buy'] += 1.5
                 signals['details'].append('EMA_GOLDEN_CROSS_CONFIRMED')
-            elif (current['ema_short'] < current['ema_long'] and 
-                  prev_1['ema_short'] < prev_1['ema_long'] and
-                  prev_2['ema_short'] >= prev_2['ema_long']):
+            elif (ema_short[-1] < ema_long[-1] and 
+                  ema_short[-2] < ema_long[-2] and
+                  ema_short[-3] >= ema_long[-3]):
                 signals['sell'] += 1.5
                 signals['details'].append('EMA_DEATH_CROSS_CONFIRMED')
         
         # Тренд фильтр
-        if current['close'] > current['ema_long']:
+        if close[-1] > ema_long[-1]:
             signals['buy'] += 0.5
         else:
             signals['sell'] += 0.5
         
         # Поддержка/сопротивление
-        support_resistance_signal = self._check_support_resistance(df)
+        support_resistance_signal = self._check_support_resistance(close, high, low)
         if support_resistance_signal == 'BUY':
             signals['buy'] += 1.0
             signals['details'].append('NEAR_SUPPORT')
@@ -95,14 +105,14 @@ class TradingStrategy:
         
         return signals
     
-    def _check_support_resistance(self, df):
+    def _check_support_resistance(self, close, high, low):
         """Проверка уровней поддержки и сопротивления"""
-        if len(df) < 20:
+        if close.size < 20:
             return 'HOLD'
         
-        current_price = df['close'].iloc[-1]
-        resistance = df['high'].tail(20).max()
-        support = df['low'].tail(20).min()
+        current_price = close[-1]
+        resistance = high[-20:].max()
+        support = low[-20:].min()
         
         resistance_distance = (resistance - current_price) / current_price
         support_distance = (current_price - support) / current_price
@@ -118,21 +128,17 @@ class TradingStrategy:
         """Расчет силы сигнала"""
         return abs(signals['buy'] - signals['sell'])
     
-    def _calculate_volume_ratio(self, df):
+    def _calculate_volume_ratio(self, volume):
         """Расчет отношения объема"""
-        if len(df) < 20:
-            return 1.0
-        current_volume = df['volume'].iloc[-1]
-        avg_volume = df['volume'].tail(20).mean()
-        return current_volume / avg_volume if avg_volume > 0 else 1.0
+        return volume_ratio(volume, 20)
     
     def calculate_position_size(self, balance, current_price, stop_loss_price, signal_strength):
         """Консервативный расчет размера позиции"""
         # Базовый риск
-        risk_amount = balance * Config.RISK_PER_TRADE
+        risk_amount = balance * CFG.risk_per_trade
         
         # Корректировка на силу сигнала (максимум +50%)
-        strength_multiplier = min(1.5, 1.0 + (signal_strength - Config.MIN_SIGNAL_STRENGTH) * 0.1)
+        strength_multiplier = min(1.5, 1.0 + (signal_strength - CFG.min_signal_strength) * 0.1)
         risk_amount *= strength_multiplier
         
         # Расчет размера позиции
@@ -141,6 +147,6 @@ class TradingStrategy:
             return 0
             
         position_size = risk_amount / price_diff
-        max_size = Config.MAX_POSITION_SIZE / current_price
+        max_size = CFG.max_position_size / current_price
         
         return min(position_size, max_size)
\ No newline at end of file
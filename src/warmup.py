@@ -0,0 +1,16 @@
+"""Compile (or load from the on-disk cache) the shared numba kernels at startup, not on the first cycle"""
+import numpy as np
+
+from src import indicators
+
+
+def warmup():
+    """Specialise the src.indicators kernels for writable and read-only float64 columns"""
+    writable = np.ones(64)
+    readonly = np.ones(64)
+    readonly.setflags(write=False)
+
+    for values in (writable, readonly):
+        indicators.compute_core_indicators(values)
+        indicators.volume_ratio(values, 20)
+        indicators.rolling_std(indicators.pct_change(values), 20)
@@ -1,6 +1,5 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 # Добавляем путь к проекту
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -1,9 +1,9 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
 from src.bybit_client import BybitClient
 from src.logger import TradingLogger
 
@@ -62,7 +62,7 @@ def test_order_placement():
         return False
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     if test_order_placement():
         print("\n✅ Тестирование ордеров завершено успешно!")
     else:
@@ -1,9 +1,9 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config._env import load_env
 from src.symbol_info import SymbolInfo
 from src.bybit_client import BybitClient
 from src.logger import TradingLogger
@@ -55,7 +55,7 @@ def test_symbol_info():
         return False
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     if test_symbol_info():
         print("\n✅ Тестирование информации о символах завершено успешно!")
     else:
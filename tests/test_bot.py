@@ -26,6 +26,14 @@ class TestTradingBot(unittest.TestCase):
         self.assertIn('ema_short', df_with_indicators.columns)
         self.assertIn('macd', df_with_indicators.columns)
         
+    def test_last_volatility_matches_rolling(self):
+        df = pd.DataFrame({'close': [100 + (i % 7) * 1.5 - i * 0.2 for i in range(60)]})
+        
+        expected = self.data_processor.calculate_volatility(df.copy())['volatility'].iloc[-1]
+        
+        self.assertAlmostEqual(self.data_processor.last_volatility(df), expected)
+        self.assertEqual(self.data_processor.last_volatility(df.head(10)), 0.0)
+        
     def test_strategy_analysis(self):
         # Создание тестовых данных с явным трендом
         data = {
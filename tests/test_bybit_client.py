@@ -0,0 +1,42 @@
+import unittest
+from unittest import mock
+import numpy as np
+from src.bybit_client import BybitClient
+
+class TestBybitClient(unittest.TestCase):
+    def setUp(self):
+        # Клиент без API-ключей и сети: подменяем только запрос
+        self.client = BybitClient.__new__(BybitClient)
+        self.client.logger = mock.Mock()
+        
+        # Bybit отдает свечи от новых к старым
+        self.klines = [
+            [str(1700000000000 + 900000 * i), '100', '101', '99', str(100.0 + i), '10', '1000']
+            for i in reversed(range(30))
+        ]
+        self.client._make_request = mock.Mock(return_value={'retCode': 0, 'result': {'list': self.klines}})
+        
+    def test_rows_ordered_oldest_first(self):
+        df = self.client.get_klines('BTCUSDT')
+        
+        timestamps = df['timestamp'].astype(np.int64).to_numpy()
+        self.assertTrue(np.all(np.diff(timestamps) > 0))
+        # iloc[-1] в стратегиях - самая свежая свеча
+        self.assertEqual(df['close'].iloc[-1], 129.0)
+        self.assertEqual(df['close'].iloc[0], 100.0)
+        
+    def test_bad_position_size_skips_only_that_row(self):
+        self.client._make_request.return_value = {'retCode': 0, 'result': {'list': [
+            {'symbol': 'BTCUSDT', 'side': 'Buy', 'size': '0.01', 'avgPrice': '60000'},
+            {'symbol': 'ETHUSDT', 'side': 'Sell', 'size': 'abc', 'avgPrice': '3000'},
+            {'symbol': 'SOLUSDT', 'side': 'Buy', 'size': '', 'avgPrice': ''},
+            {'symbol': 'XRPUSDT', 'side': 'Sell', 'size': '100', 'avgPrice': '0.5'},
+        ]}}
+        
+        positions = self.client.get_open_positions()
+        
+        self.assertEqual([p['symbol'] for p in positions], ['BTCUSDT', 'XRPUSDT'])
+        self.assertEqual(positions[1]['size'], 100.0)
+
+if __name__ == '__main__':
+    unittest.main()
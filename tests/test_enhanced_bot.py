@@ -0,0 +1,42 @@
+import unittest
+from unittest import mock
+import numpy as np
+
+try:
+    import enhanced_bot
+except ImportError as e:  # telegram / database не установлены
+    raise unittest.SkipTest(f"enhanced_bot dependencies missing: {e}")
+
+class TestEnhancedBot(unittest.TestCase):
+    def setUp(self):
+        # Фильтр RSI отключен: проверяем только пересечение EMA и объем
+        self.bot = enhanced_bot.EnhancedTradingBot(mock.Mock(), {'RSI_OVERSOLD': 100}, ['BTC/USDT'])
+        self.bot.should_trade = mock.Mock(return_value=False)
+        
+        # Снижение, затем закрытая свеча k с пересечением EMA вверх и обычным объемом;
+        # последняя строка - только что открытая свеча почти без объема
+        close = np.append(100 - 0.2 * np.arange(60), [102.0, 102.0])
+        volume = np.append(np.full(61, 1000.0), 1.0)
+        self.timestamps = (1700000000000 + np.arange(62) * 900000).astype(np.int64)
+        self.data = {'timestamp': self.timestamps, 'close': close, 'volume': volume}
+        self.bot.get_market_data = mock.Mock(return_value=self.data)
+        
+    def test_crossover_on_closed_bar_signals_after_gate(self):
+        bar_open = int(self.timestamps[-1])
+        
+        self.assertTrue(self.bot._analyze_one('BTC/USDT', 1000.0, bar_open))
+        
+        signals = self.bot.should_trade.call_args.args[1]
+        self.assertEqual(signals.signal, 'BUY')
+        self.assertAlmostEqual(signals.volume_ratio, 1.0)
+        
+    def test_unpublished_bar_is_reported_and_not_reanalyzed(self):
+        bar_open = int(self.timestamps[-1])
+        self.bot._analyze_one('BTC/USDT', 1000.0, bar_open)
+        
+        # Биржа еще не отдала следующую свечу - тик нужно повторить
+        self.assertFalse(self.bot._analyze_one('BTC/USDT', 1000.0, bar_open + 900000))
+        self.assertEqual(self.bot.should_trade.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+import pandas as pd
+import ta
+from src.indicators import ema, rsi, macd, volume_ratio, pct_change, rolling_std
+
+class TestIndicators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.close = 100 + np.cumsum(rng.normal(0, 1, 300))
+        self.series = pd.Series(self.close)
+        
+    def assertSeriesClose(self, actual, expected):
+        np.testing.assert_allclose(actual, expected.to_numpy(), rtol=1e-10, atol=1e-10, equal_nan=True)
+        
+    def test_ema_matches_ta(self):
+        for window in (9, 21, 50):
+            expected = ta.trend.EMAIndicator(self.series, window=window).ema_indicator()
+            self.assertSeriesClose(ema(self.close, window), expected)
+            
+    def test_rsi_matches_ta(self):
+        expected = ta.momentum.RSIIndicator(self.series, window=14).rsi()
+        self.assertSeriesClose(rsi(self.close, 14), expected)
+        
+    def test_macd_matches_ta(self):
+        expected = ta.trend.MACD(self.series)
+        line, signal, diff = macd(self.close, 12, 26, 9)
+        
+        self.assertSeriesClose(line, expected.macd())
+        self.assertSeriesClose(signal, expected.macd_signal())
+        self.assertSeriesClose(diff, expected.macd_diff())
+        
+    def test_volume_ratio(self):
+        volume = pd.Series(np.arange(1.0, 31.0))
+        
+        expected = volume.iloc[-1] / volume.tail(20).mean()
+        
+        self.assertAlmostEqual(volume_ratio(volume.to_numpy(), 20), expected)
+        self.assertEqual(volume_ratio(volume.to_numpy()[:10], 20), 1.0)
+        self.assertEqual(volume_ratio(np.zeros(25), 20), 1.0)
+        
+    def test_accepts_readonly_arrays(self):
+        close = self.close.copy()
+        close.setflags(write=False)
+        
+        self.assertEqual(ema(close, 9).shape, close.shape)
+        self.assertAlmostEqual(volume_ratio(close, 20), volume_ratio(self.close, 20))
+        
+    def test_rolling_std_matches_pandas(self):
+        returns = self.series.pct_change()
+        self.assertSeriesClose(pct_change(self.close), returns)
+        
+        for window in (5, 20):
+            expected = returns.rolling(window=window).std()
+            self.assertSeriesClose(rolling_std(returns.to_numpy(), window), expected)
+
+if __name__ == '__main__':
+    unittest.main()
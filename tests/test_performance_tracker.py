@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.performance_tracker import PerformanceTracker
+
+class TestPerformanceTracker(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        os.remove(self.path)
+        patcher = mock.patch('src.performance_tracker.Config.TRADE_LOG_FILE', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(lambda: os.path.exists(self.path) and os.remove(self.path))
+        self.tracker = PerformanceTracker()
+        self.addCleanup(self.tracker.close)
+        
+    def test_trades_appended_once_each(self):
+        for pnl in (10.0, -5.0, 2.5):
+            self.tracker.record_trade({'symbol': 'BTCUSDT', 'pnl': pnl})
+        
+        with open(self.path, encoding='utf-8') as f:
+            saved = [json.loads(line) for line in f]
+        
+        self.assertEqual([t['pnl'] for t in saved], [10.0, -5.0, 2.5])
+        
+    def test_previous_session_file_replaced(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump([{'symbol': 'ETHUSDT', 'pnl': 1.0}], f)
+        
+        self.tracker.record_trade({'symbol': 'BTCUSDT', 'pnl': 10.0})
+        
+        with open(self.path, encoding='utf-8') as f:
+            saved = [json.loads(line) for line in f]
+        
+        self.assertEqual(saved, [self.tracker.trades[0]])
+        
+    def test_running_metrics(self):
+        trades = [
+            {'symbol': 'BTCUSDT', 'pnl': 10.0, 'balance_after': 1010.0},
+            {'symbol': 'ETHUSDT', 'pnl': -30.0, 'balance_after': 980.0},
+            {'symbol': 'BTCUSDT', 'pnl': -5.0, 'balance_after': 975.0},
+            {'symbol': 'BTCUSDT', 'pnl': 20.0, 'balance_after': 995.0},
+        ]
+        for trade in trades:
+            self.tracker.record_trade(trade)
+        
+        perf = self.tracker.performance_data
+        self.assertEqual(perf['total_trades'], 4)
+        self.assertEqual(perf['winning_trades'], 2)
+        self.assertAlmostEqual(perf['total_pnl'], -5.0)
+        self.assertAlmostEqual(perf['profit_factor'], 30.0 / 35.0)
+        self.assertAlmostEqual(perf['max_drawdown'], 35.0 / 1010.0)
+        
+        btc = self.tracker.get_strategy_performance()['BTCUSDT']
+        self.assertEqual(btc['trades'], 3)
+        self.assertAlmostEqual(btc['win_rate'], 2 / 3)
+        self.assertAlmostEqual(btc['avg_pnl'], 25.0 / 3)
+
+if __name__ == '__main__':
+    unittest.main()
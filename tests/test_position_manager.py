@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+from src.position_manager import PositionManager
+from src.positions import Positions
+
+class TestPositionManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = PositionManager(None)
+        self.manager.active_positions = {
+            'SOLUSDT': {'side': 'Buy', 'stop_loss': 95.0, 'take_profit': 110.0},
+            'XRPUSDT': {'side': 'Sell', 'stop_loss': 0.55, 'take_profit': 0.45},
+            'ADAUSDT': {'side': 'Buy', 'stop_loss': 0.40, 'take_profit': 0.60},
+            'DOTUSDT': {'side': 'Sell', 'stop_loss': 7.0, 'take_profit': 5.0},
+        }
+
+    def test_exits_match_scalar_rules(self):
+        prices = {'SOLUSDT': 94.0, 'XRPUSDT': 0.44, 'ADAUSDT': 0.50, 'DOTUSDT': 7.5}
+
+        exits = self.manager.check_exits(prices)
+
+        self.assertEqual(exits, {'SOLUSDT': 'Stop Loss', 'XRPUSDT': 'Take Profit', 'DOTUSDT': 'Stop Loss'})
+
+    def test_strategy_signal_sides_exit(self):
+        # main.py и professional_bot.py сохраняют сторону как сигнал стратегии
+        self.manager.active_positions = {
+            'LINKUSDT': {'side': 'BUY', 'stop_loss': 20.0, 'take_profit': 30.0},
+            'DOTUSDT': {'side': 'SELL', 'stop_loss': 7.0, 'take_profit': 5.0},
+        }
+
+        exits = self.manager.check_exits({'LINKUSDT': 19.0, 'DOTUSDT': 4.5})
+
+        self.assertEqual(exits, {'LINKUSDT': 'Stop Loss', 'DOTUSDT': 'Take Profit'})
+
+    def test_missing_prices_and_unknown_sides_are_skipped(self):
+        self.manager.active_positions['LINKUSDT'] = {'side': 'None', 'stop_loss': 20.0, 'take_profit': 30.0}
+
+        exits = self.manager.check_exits({'LINKUSDT': 10.0, 'ADAUSDT': None})
+
+        self.assertEqual(exits, {})
+        self.assertEqual(self.manager.check_exits({}), {})
+
+    def test_sync_uses_snapshot_and_keeps_positions_on_api_error(self):
+        self.manager.client = mock.Mock()
+        self.manager.client.get_positions_snapshot.return_value = Positions.from_api([
+            {'symbol': 'SOLUSDT', 'side': 'Buy', 'size': '2', 'avgPrice': '100', 'unrealisedPnl': '3.5'},
+            {'symbol': 'XRPUSDT', 'side': 'Sell', 'size': '50', 'avgPrice': '0.5', 'unrealisedPnl': '-1.0'},
+        ])
+
+        self.manager.sync_positions()
+
+        self.assertEqual(set(self.manager.active_positions), {'SOLUSDT', 'XRPUSDT'})
+        self.assertAlmostEqual(self.manager.unrealised_pnl(), 2.5)
+
+        self.manager.client.get_positions_snapshot.return_value = None
+        self.manager.sync_positions()
+
+        self.assertEqual(set(self.manager.active_positions), {'SOLUSDT', 'XRPUSDT'})
+        self.assertAlmostEqual(self.manager.unrealised_pnl(), 2.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from src.positions import Positions
+
+class TestPositions(unittest.TestCase):
+    def test_from_api_skips_empty_slots(self):
+        raw = [
+            {'symbol': 'SOLUSDT', 'side': 'Buy', 'size': '2', 'avgPrice': '150', 'unrealisedPnl': '3.5', 'leverage': '2'},
+            {'symbol': 'XRPUSDT', 'side': '', 'size': '0', 'avgPrice': '', 'unrealisedPnl': '', 'leverage': ''},
+            {'symbol': 'ADAUSDT', 'side': 'Sell', 'size': '100', 'avgPrice': '0.5', 'unrealisedPnl': '-1.25', 'leverage': ''},
+        ]
+        
+        positions = Positions.from_api(raw)
+        
+        self.assertEqual(positions.symbols, ['SOLUSDT', 'ADAUSDT'])
+        self.assertEqual(len(positions), 2)
+        self.assertAlmostEqual(positions.total_unrealised_pnl(), 2.25)
+        self.assertEqual(list(positions.leverage), [2.0, 1.0])
+        self.assertEqual(list(positions.notional), [300.0, 50.0])
+        
+    def test_empty(self):
+        positions = Positions.from_api([])
+        self.assertEqual(len(positions), 0)
+        self.assertEqual(positions.total_unrealised_pnl(), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
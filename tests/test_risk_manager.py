@@ -0,0 +1,75 @@
+import unittest
+from advanced_risk_manager import AdvancedRiskManager, replay_trades
+
+class TestAdvancedRiskManager(unittest.TestCase):
+    def setUp(self):
+        self.risk_manager = AdvancedRiskManager({
+            'initial_balance': 1000,
+            'risk_management': {'risk_per_trade': 0.02, 'max_drawdown': 0.15}
+        })
+        
+    def test_position_size(self):
+        # 2% риска при стопе в 2% от цены входа = позиция на весь баланс
+        size = self.risk_manager.calculate_position_size(100.0, 98.0, 'BTCUSDT')
+        self.assertAlmostEqual(size, 10.0)
+        
+        # Нулевой риск по цене - нулевая позиция
+        self.assertEqual(self.risk_manager.calculate_position_size(100.0, 100.0, 'BTCUSDT'), 0)
+        
+    def test_batch_position_sizes_match_scalar(self):
+        entries = [100.0, 2.5, 0.45, 30.0]
+        stops = [98.0, 2.45, 0.45, 31.5]
+
+        sizes = self.risk_manager.calculate_position_sizes(entries, stops)
+
+        for size, entry, stop in zip(sizes, entries, stops):
+            self.assertAlmostEqual(size, self.risk_manager.calculate_position_size(entry, stop, 'TEST'))
+
+    def test_consecutive_losses_halve_size(self):
+        for _ in range(3):
+            self.risk_manager.update_after_trade(-1.0, False)
+        
+        size = self.risk_manager.calculate_position_size(100.0, 98.0, 'BTCUSDT')
+        self.assertAlmostEqual(size, 0.5 * 997.0 * 0.02 / 0.02 / 100.0)
+        
+    def test_drawdown_stop(self):
+        self.risk_manager.update_after_trade(100.0, True)
+        self.assertFalse(self.risk_manager.should_stop_trading())
+        self.assertEqual(self.risk_manager.peak_balance, 1100.0)
+        
+        self.risk_manager.update_after_trade(-200.0, False)
+        self.assertTrue(self.risk_manager.should_stop_trading())
+        
+        metrics = self.risk_manager.get_performance_metrics()
+        self.assertEqual(metrics['total_trades'], 2)
+        self.assertAlmostEqual(metrics['win_rate'], 50.0)
+        
+    def test_cached_metrics_refresh_after_trade(self):
+        metrics = self.risk_manager.get_performance_metrics()
+        metrics['total_trades'] = 99
+        self.assertEqual(self.risk_manager.get_performance_metrics()['total_trades'], 0)
+        
+        self.risk_manager.update_after_trade(50.0, True)
+        self.assertEqual(self.risk_manager.get_performance_metrics()['current_balance'], 1050.0)
+        
+    def test_replay_matches_sequential_updates(self):
+        pnls = [50.0, -120.0, -30.0, 80.0, -10.0, -15.0, -5.0]
+        wins = [p > 0 for p in pnls]
+        
+        max_dd = 0.0
+        max_consec = 0
+        for pnl, win in zip(pnls, wins):
+            self.risk_manager.update_after_trade(pnl, win)
+            metrics = self.risk_manager.get_performance_metrics()
+            max_dd = max(max_dd, metrics['drawdown'] / 100)
+            max_consec = max(max_consec, metrics['consecutive_losses'])
+        
+        balance, replay_dd, win_rate, replay_consec = replay_trades(pnls, wins, 1000)
+        
+        self.assertAlmostEqual(balance, self.risk_manager.current_balance)
+        self.assertAlmostEqual(replay_dd, max_dd)
+        self.assertAlmostEqual(win_rate * 100, metrics['win_rate'])
+        self.assertEqual(replay_consec, max_consec)
+
+if __name__ == '__main__':
+    unittest.main()
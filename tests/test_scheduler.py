@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+from src.scheduler import Scheduler
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch('src.scheduler.time.monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.calls = []
+        self.scheduler = Scheduler()
+        self.scheduler.every(120, lambda: self.calls.append('cycle'))
+        self.scheduler.every(1800, lambda: self.calls.append('report'))
+
+    def test_sleeps_until_next_job(self):
+        self.assertEqual(self.scheduler.idle_seconds(), 120)
+
+        self.now += 120
+        self.scheduler.run_pending()
+
+        self.assertEqual(self.calls, ['cycle'])
+        self.assertEqual(self.scheduler.idle_seconds(), 120)
+
+    def test_keeps_interval_grid_and_skips_missed_runs(self):
+        # Небольшое опоздание не сдвигает сетку
+        self.now += 125
+        self.scheduler.run_pending()
+        self.assertEqual(self.scheduler.idle_seconds(), 115)
+
+        # Долгая задержка: один запуск, без догоняющей серии
+        self.now += 1000
+        self.scheduler.run_pending()
+        self.scheduler.run_pending()
+        self.assertEqual(self.calls, ['cycle', 'cycle'])
+        self.assertEqual(self.scheduler.idle_seconds(), 120)
+
+if __name__ == '__main__':
+    unittest.main()
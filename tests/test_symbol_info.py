@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+from src.symbol_info import SymbolInfo
+
+class TestSymbolInfo(unittest.TestCase):
+    def setUp(self):
+        # Без API-ключей: клиент подменяем целиком
+        self.info = SymbolInfo.__new__(SymbolInfo)
+        self.info.client = mock.Mock()
+        self.info.logger = mock.Mock()
+        self.info.symbol_info_cache = {}
+        self.info._instruments_loaded = False
+        
+    def test_failed_load_is_retried(self):
+        self.info.client._make_request.return_value = None
+        
+        spec = self.info.get_symbol_info('SOLUSDT')
+        
+        self.assertEqual(spec.qty_step, 0.1)
+        self.assertFalse(self.info._instruments_loaded)
+        
+        self.info.client._make_request.return_value = {'result': {'list': [
+            {'symbol': 'SOLUSDT', 'lotSizeFilter': {'minOrderQty': '0.5', 'maxOrderQty': '100', 'qtyStep': '0.5'}}
+        ]}}
+        
+        spec = self.info.get_symbol_info('SOLUSDT')
+        
+        self.assertEqual(spec.qty_step, 0.5)
+        self.assertTrue(self.info._instruments_loaded)
+        self.assertEqual(self.info.client._make_request.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()